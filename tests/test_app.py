@@ -0,0 +1,107 @@
+"""Tests for recording start-up when the saved microphone is stale."""
+
+import os
+import sys
+import types
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+try:
+    import sounddevice  # noqa: F401
+except (ImportError, OSError):
+    # No PortAudio on this machine — the tests below replace every call
+    # into sounddevice anyway, so a bare module is enough to import.
+    sys.modules["sounddevice"] = types.ModuleType("sounddevice")
+
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from voiceboard import app as app_module  # noqa: E402
+from voiceboard.audio import AudioRecorder  # noqa: E402
+from voiceboard.config import AppConfig  # noqa: E402
+from voiceboard.ui import MainWindow, create_tray_icon  # noqa: E402
+
+
+class _FakeTranscriber:
+    def __init__(self):
+        self.started = False
+
+    def start(self) -> None:
+        self.started = True
+
+
+@pytest.fixture(scope="module")
+def qt_app():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def voiceboard_app(qt_app, monkeypatch):
+    """A VoiceBoardApp wired to a real window but fake audio/network."""
+    monkeypatch.setattr(app_module, "ensure_typer_ready", lambda: None)
+
+    vb = app_module.VoiceBoardApp.__new__(app_module.VoiceBoardApp)
+    vb.config = AppConfig(soniox_api_key="key", input_device="7")
+    vb.recorder = AudioRecorder()
+    vb.transcriber = _FakeTranscriber()
+    vb._recording = False
+    vb._mic_list_loaded = False
+    vb.window = MainWindow()
+    vb.window.load_config(vb.config)
+    vb.tray = create_tray_icon(qt_app, vb.window)
+    return vb
+
+
+def _fake_open(monkeypatch, opened: list, bad_devices: set):
+    """Replace AudioRecorder._open_stream; fail for *bad_devices*."""
+    def _open_stream(self):
+        if self.device in bad_devices:
+            raise RuntimeError("Could not open an audio input stream.")
+        opened.append(self.device)
+        self._stream = object()
+    monkeypatch.setattr(AudioRecorder, "_open_stream", _open_stream)
+
+
+def test_stale_saved_device_falls_back_to_default(voiceboard_app, monkeypatch):
+    # Device #7 is gone, but the unscanned list still holds it as saved
+    opened: list = []
+    _fake_open(monkeypatch, opened, bad_devices={7})
+
+    voiceboard_app._start_recording()
+
+    assert opened == [None]
+    assert voiceboard_app._recording
+    assert voiceboard_app.window.record_btn.recording
+    assert voiceboard_app.transcriber.started
+    assert voiceboard_app.window.selected_device_index() == ""
+    assert voiceboard_app.window._status_recording.text() == (
+        "⚠️ Selected microphone unavailable — using System Default"
+    )
+
+
+def test_unopenable_device_retries_on_default(voiceboard_app, monkeypatch):
+    # Device #7 is still listed but PortAudio refuses to open it
+    monkeypatch.setattr(
+        app_module, "list_input_devices", lambda: [{"index": 7, "name": "Mic", "channels": 1}]
+    )
+    voiceboard_app._refresh_mic_list()
+    opened: list = []
+    _fake_open(monkeypatch, opened, bad_devices={7})
+
+    voiceboard_app._start_recording()
+
+    assert opened == [None]
+    assert voiceboard_app._recording
+    assert voiceboard_app.window.selected_device_index() == ""
+
+
+def test_failed_open_rolls_back_recording_state(voiceboard_app, monkeypatch):
+    _fake_open(monkeypatch, [], bad_devices={7, None})
+
+    voiceboard_app._start_recording()
+
+    assert not voiceboard_app._recording
+    assert not voiceboard_app.window.record_btn.recording
+    assert not voiceboard_app.transcriber.started
+    assert voiceboard_app.window._status_idle.text().startswith("❌ Error:")
@@ -76,6 +76,9 @@ a = Analysis(
         'dbus',
         'dbus.mainloop',
         'dbus.mainloop.glib',
+        # Faster event loop for the transcriber (see transcriber._new_event_loop)
+        'uvloop',
+        'winloop',
     ] + collect_submodules('pynput'),
     hookspath=[],
     hooksconfig={},
@@ -5,17 +5,18 @@ import os
 import platform
 import signal
 import sys
+import time
 
-from PySide6.QtWidgets import QApplication, QMessageBox
-from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import Qt, QTimer
 
 from voiceboard.config import AppConfig, _config_dir
 from voiceboard.audio import AudioRecorder, list_input_devices
 from voiceboard.transcriber import RealtimeTranscriber
 from voiceboard.typer import enqueue_text, ensure_ready as ensure_typer_ready
 from voiceboard.hotkeys import HotkeyManager
-from voiceboard.ui import MainWindow, create_tray_icon, svg_to_icon, STYLESHEET
-from voiceboard.resources import TRAY_ICON_SVG, TRAY_ICON_RECORDING_SVG
+from voiceboard.ui import MainWindow, create_tray_icon, set_tray_recording
+from voiceboard.resources import load_stylesheet
 from voiceboard.autostart import set_autostart
 
 _LOCK_FILE = _config_dir() / "voiceboard.pid"
@@ -110,7 +111,6 @@ def _kill_existing_instance() -> None:
         pass  # already gone or not ours
 
     # Give it a moment to exit, then force-kill if necessary
-    import time
     for _ in range(20):  # wait up to 2 seconds
         time.sleep(0.1)
         try:
@@ -165,6 +165,7 @@ class VoiceBoardApp:
         )
         self.hotkeys = HotkeyManager()
         self._recording = False
+        self._mic_list_loaded = False
 
     @staticmethod
     def _diag(msg: str) -> None:
@@ -189,16 +190,16 @@ class VoiceBoardApp:
         self.qt_app.setApplicationName("VoiceBoard")
         self.qt_app.setQuitOnLastWindowClosed(False)
         self._diag("startup: applying stylesheet")
-        self.qt_app.setStyleSheet(STYLESHEET)
+        self.qt_app.setStyleSheet(load_stylesheet())
 
         # Create main window
         self._diag("startup: creating main window")
         self.window = MainWindow()
         self.window.load_config(self.config)
 
-        # Populate microphone list
-        self._diag("startup: scanning microphones")
-        self._refresh_mic_list()
+        # The microphone list is scanned the first time the settings page
+        # opens — device enumeration goes through PortAudio and can be
+        # slow, and only that page shows it (see _on_settings_opened).
         self.window.mic_refresh_btn.clicked.connect(self._refresh_mic_list)
 
         # Create system tray
@@ -238,22 +239,24 @@ class VoiceBoardApp:
         self.window.mic_combo.currentIndexChanged.connect(self._schedule_save)
         self.window.mic_combo.currentIndexChanged.connect(self._on_mic_changed)
 
-        # Connect bridge signals (for thread-safe updates from hotkeys)
-        self.window.signals.toggle_signal.connect(self._on_toggle)
-        self.window.signals.ptt_press_signal.connect(self._on_ptt_press)
-        self.window.signals.ptt_release_signal.connect(self._on_ptt_release)
-        self.window.signals.transcription_text.connect(self._on_transcription_text)
-        self.window.signals.transcription_error.connect(self._on_transcription_error)
+        # Connect window signals (for thread-safe updates from hotkeys).
+        # They are emitted from the hotkey and transcriber threads — queue
+        # them explicitly so the handlers always run on the GUI thread.
+        self.window.toggle_signal.connect(self._on_toggle, Qt.QueuedConnection)
+        self.window.ptt_press_signal.connect(self._on_ptt_press, Qt.QueuedConnection)
+        self.window.ptt_release_signal.connect(self._on_ptt_release, Qt.QueuedConnection)
+        self.window.transcription_text.connect(self._on_transcription_text, Qt.QueuedConnection)
+        self.window.transcription_error.connect(self._on_transcription_error, Qt.QueuedConnection)
 
-        # Audio level callback
-        self.recorder.on_level = lambda level: self.window.signals.audio_level.emit(level)
+        # Audio level callback — the window polls the latest value on a timer
+        self.recorder.on_level = self.window.post_audio_level
 
         # Audio chunk callback — stream PCM to the realtime transcriber
         self.recorder.on_audio_chunk = self._on_audio_chunk
 
         # Transcriber callbacks — emit Qt signals for thread safety
-        self.transcriber.on_text = lambda text, bs, has_final, final_text: self.window.signals.transcription_text.emit(text, bs, has_final, final_text)
-        self.transcriber.on_error = lambda err: self.window.signals.transcription_error.emit(err)
+        self.transcriber.on_text = lambda text, bs, has_final, final_text: self.window.transcription_text.emit(text, bs, has_final, final_text)
+        self.transcriber.on_error = lambda err: self.window.transcription_error.emit(err)
 
         # On macOS, check accessibility BEFORE starting pynput — pynput's
         # CGEventTap will segfault if the process is not trusted.
@@ -316,6 +319,8 @@ class VoiceBoardApp:
 
     def _on_settings_opened(self) -> None:
         """Start mic preview when the settings page is shown."""
+        if not self._mic_list_loaded:
+            self._refresh_mic_list()
         if not self._recording:
             self._start_mic_preview()
 
@@ -342,6 +347,7 @@ class VoiceBoardApp:
         except Exception:
             devices = []
         self.window.populate_mic_list(devices, self.config.input_device)
+        self._mic_list_loaded = True
 
     def _setup_hotkeys(self) -> None:
         """Configure and start global hotkey listener."""
@@ -349,9 +355,9 @@ class VoiceBoardApp:
             self.config.toggle_shortcut,
             self.config.ptt_shortcut,
         )
-        self.hotkeys.on_toggle = lambda: self.window.signals.toggle_signal.emit()
-        self.hotkeys.on_ptt_press = lambda: self.window.signals.ptt_press_signal.emit()
-        self.hotkeys.on_ptt_release = lambda: self.window.signals.ptt_release_signal.emit()
+        self.hotkeys.on_toggle = lambda: self.window.toggle_signal.emit()
+        self.hotkeys.on_ptt_press = lambda: self.window.ptt_press_signal.emit()
+        self.hotkeys.on_ptt_release = lambda: self.window.ptt_release_signal.emit()
         self.hotkeys.start()
 
     def _on_record_button(self) -> None:
@@ -378,7 +384,7 @@ class VoiceBoardApp:
     def _start_recording(self) -> None:
         """Begin audio capture and realtime transcription."""
         if not self.config.soniox_api_key:
-            self.window.signals.status_update.emit(
+            self.window.status_update.emit(
                 "⚠️ Please set your Soniox API key in Settings."
             )
             return
@@ -390,7 +396,7 @@ class VoiceBoardApp:
 
         self._recording = True
         self.window.set_recording_state(True)
-        self.tray.setIcon(svg_to_icon(TRAY_ICON_RECORDING_SVG))
+        set_tray_recording(self.tray, True)
         self.tray.setToolTip("VoiceBoard — Recording...")
 
         # Check if the selected mic changed since the preview started
@@ -401,10 +407,39 @@ class VoiceBoardApp:
             self._stop_mic_preview()
             self.recorder.device = new_device
 
+        # Start capturing audio (chunks will be forwarded to the transcriber).
+        # Do this first so a mic that can't be opened leaves no session behind.
+        try:
+            self._start_recorder()
+        except Exception as exc:
+            self._recording = False
+            self.window.set_recording_state(False)
+            set_tray_recording(self.tray, False)
+            self.tray.setToolTip("VoiceBoard — Voice Keyboard")
+            self.window.status_update.emit(f"❌ Error: {str(exc)[:80]}")
+            return
+
         # Start the realtime WebSocket transcription session
         self.transcriber.start()
-        # Start capturing audio (chunks will be forwarded to the transcriber)
-        self.recorder.start()
+
+    def _start_recorder(self) -> None:
+        """Start audio capture, falling back to the default mic if needed.
+
+        A saved device index can go stale (device unplugged, or renumbered
+        by PortAudio); retry on the system default before giving up.
+        """
+        try:
+            self.recorder.start()
+        except Exception:
+            if self.recorder.device is None:
+                raise
+            self.recorder.device = None
+            self.recorder.start()
+            # Show (and save) the device that is actually recording
+            self.window.mic_combo.setCurrentIndex(0)
+            self.window.status_update.emit(
+                "⚠️ Selected microphone unavailable — using System Default"
+            )
 
     def _stop_recording(self) -> None:
         """Stop recording and disconnect from the Soniox API.
@@ -415,8 +450,8 @@ class VoiceBoardApp:
         self._recording = False
 
         self.window.set_recording_state(False)
-        self.window.signals.status_update.emit("Stopped — text available below")
-        self.tray.setIcon(svg_to_icon(TRAY_ICON_SVG))
+        self.window.status_update.emit("Stopped — text available below")
+        set_tray_recording(self.tray, False)
         self.tray.setToolTip("VoiceBoard — Voice Keyboard")
 
         # Stop the recorder — no more audio will be captured.
@@ -470,7 +505,7 @@ class VoiceBoardApp:
 
     def _on_transcription_error(self, error: str) -> None:
         """Handle transcription error."""
-        self.window.signals.status_update.emit(f"❌ Error: {error[:80]}")
+        self.window.status_update.emit(f"❌ Error: {error[:80]}")
 
     def _schedule_save(self) -> None:
         """Restart the debounce timer — auto-save will fire after the delay."""
@@ -215,8 +215,21 @@ if _SYSTEM == "Linux":
         _SESSION_TYPE = "wayland" if os.environ.get("WAYLAND_DISPLAY") else "x11"
 
 
+# Result of the evdev device probe, cached on first call — device access
+# only changes with a re-login, and the probe opens every input device.
+_evdev_available: Optional[bool] = None
+
+
 def _evdev_has_devices() -> bool:
-    """Check if we can open any keyboard devices via evdev."""
+    """Check if we can open any keyboard devices via evdev (cached)."""
+    global _evdev_available
+    if _evdev_available is None:
+        _evdev_available = _probe_evdev_devices()
+    return _evdev_available
+
+
+def _probe_evdev_devices() -> bool:
+    """Try to open the input devices and look for a keyboard."""
     try:
         import evdev
         from evdev import ecodes
@@ -0,0 +1,361 @@
+# Resource object code (Python 3)
+# Created by: object code
+# Created by: The Resource Compiler for Qt version 6.12.0
+# WARNING! All changes made in this file will be lost!
+
+from PySide6 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x04\xfc\
+(\
+\xb5/\xfd`\xf0\x13\x95'\x00\x16\xae\x8c1pMs\
+\xfc\xff\xff\xff\xffW\xe18\x82b7\x92\x94\x91HY\
+h\x12i-\x89\xccNR\x90\x87\xa8\x8d\xe2D\xb6\xd6\
+$\x1d\xb4\xb4d\xb2\xb8\x02\xe6\x7f\xfe\xe7\x1dB\x7f\x00\
+}\x00\x81\x00\x97\x06\x81\xa1PH(\x09 \x9a\x049\
+\x8bE\xbaf\xda\xb9>unu\x96\x00\xde\xd8\xc2-\
+\xecg\x8e\xe4\x88\x00g\x85\xc8\xdel\xe6\xf9I3\x8f\
+\x138Zh\xa1\x8a\xb3\x9cJ\x0a\x9f87\xea\x1a\x0f\
+\xb8\x98\xa3\x8c\xb8gM\xec\x0d\x8c\xb3th\x9c\xbd1\
+{+0\x14\x03\x02\xc7\x1b\x0f\xdf\xe8\xa6s\xa4\x1bg\
+Rr\xe2&\xed_\xd8R\xd3\xd6\xb1\xf7Ov\x9c\xbd\
+s\x9aq\xcf\x9cU\x96!_]\xf4\xa5\x17\xc3\xa6\x1a\
+\x8e\xc0 Y\xdd.:\xdc\x1a\x1b~\x89\x87\xeb_\xb1\
+\x05\x8c?<\xe9\x9c\x1d\x1a\x1f\x8dz\xb4,\x8am(\
+C\xdd \xcdX\x0f\x0fR\xc5P=\x90%G\x12\x14\
+U\x1d\x1dx6\xc5\xe3\x07\x1f\x1cq\x92\xb1\xa5\xa8\xdc\
+\xab>\xc3\xd2j\xa7\x8f\xa4\xfe\x93Bl\xab,\xbf\xdf\
+\xb2^|\xd8\xc3\xa2\xb4>\xd34w@\xb4\x8bfv\
+\x8c\xabM\x1a\xfdg\xb6\xc6w\xf3\xea\xd6q\xfd\xd9)\
+F1\xaa\xb8\xd8\x92V\x07\xa2A\xcer\x8eNAh\
+\x13\x07\xc2\x85@2]\xae\xcb\xfc\xcb+\x1a\x868\xea\
+\x00\xe0\xcd\x1f@a\xf2\xd7\x96\x1c\xbfiS\x82\x81\xc2\
+\xbe\xbd\xb6\xd0\xfd\x06\xdfi\x96\xe1JLN@\xaag\
+\xf6F\xf2\xbd$sXV\xae\xea\xaa\x1e\x1e\xa6\x07\xdf\
+\xbe\x1dqN!c8K\xdd~\xbfV\x22Ck\xca\
+\xb2\x8f\xddq\xfa\x0b;\xce\x86\xabU\x0f\xc8\xd9\xbbT\
+\xd4J+Ilk\xc7\xe7\x10Q\x0bT\xe4Z\xd95\
+\xeb\xe0:p\xe6\xd0\xcc\x8a\x5c\x02\x7fg\x1d\xfa\xbf]\
+\x01\x1a\xfdi\x82\xa2h\xa1\x8d\xac\xb2g\x18\x03\xf6&\
+\x84':4\xab\x11\xd2\x93^\xb4\xd3RQ\x8aR\x14\
+}o\x1f\xf5\x9f\x11\x1e\x82\xb3@\x155@]\x0a\x9e\
+\xb3L\x07\xceBM\x02\x8bi<D\xa3\xf0Yf\xcb\
+\x87e\x9c\x9bY?\xd9W\xabs\xfd\x9dU\xc9\x85\xfd\
+\xce\x1cKR\x87\x19\x98\x08\xb6\xdcogQ\x1c\xf6\x0b\
+\xe6\xf4\xe5E\x14UQ\x0d\x0f\xda\xc8y\xce\xbd|;\
+\x97h\xdf\xc1\xc3\xb6\x0d\xfd\xa7X\x5c\xce.T\x811\
+\xa8\xf1%2$4\x22IRP\xca0\x06q\x8c!\
+\x08I\x0b\xa5\xf4\xd2`\x10\x0e\xe1\x08\x82!\x08I\x09\
+\x10\xe1\x04H@\x90\x80H\x92`\x22\x8a$j\x0eY\
+\xac\x88\xcb\xdf\xb4RU))\x15\x00%-i\xb5\x88\
+\x1c0hK\x13\xa7\xaf\xa0\x0cW\xe2\x83\x9f\xca\xa6*\
+\x82\xd4\x0f-L@\x863r=\x170\x22\xe4\x93\x18\
+8\x12Q\x96\x86\xe8\xbe\xc3\xd8\xdb\xe5\x0b:%\x90\x09\
+H\x12P\x99H\xc3\xdb\x11\x14\xcc\x99.\xdfF\x0b\x93\
+W\x0d\x0c8\x12:\x90B\xb10 ]b\xddO\x97\
+\xfeefUW\xa5\xe9\xee\x0e\xd0G0M\x0b\x8e\xd4\
+m\xcbq9X\x91\x8dU&\xcd\xe4\x82\x15ET\x15\
+z\xc2T=9\x22\xafn\x9e\x94\xd45\xfc\x1ay~\
+\xa5\xb1\xd6s\xceI\x9ak\xcd\xfa]x0\x1b\xa0e\
+GC\xact\x8b\xcc\xcf\xe5\xd8p9\x09f]\x0f\xd3\
+Vn.\x01\xe2g`\xbc^\xb7\xeb\xcd'\x04\x98\xc9\
+y]\xc1\xfe\x9f\x8f\x8e5\xf1\xbb\xf0\xf8\xdbD\x9bT\
+\xcc#\x9f~\xaa\x0f\x94\xb6qv\x81\xa0a\xab\xa9\xab\
+\xd3\x0e>z\x07\x9a\x96\xd0\x09\xd8\x0c\xa5\xe4\xe9\xa7\x0f\
+\x1f(\xfd\x0f\xb3\xcb,'\xc7\x02\x0e\x0e\xb0\x1e\xb9\x9c\
+1\x92\xa9'\x0f\xda+\x85\xf2\x800\x0d\x10\xa3e\x16\
+&\xa5\xfb\x06\xbcRGa\xa4\x01\x85\xa9\xf9)y6\
+\x10v\xcb;|r\xee\xeb\xe7\xdb\xc2\x91\xea\xaaL4\
+\xfd75\x7f\xb4\x1b\xe4N\x91\x0d\x10\xc2\xb48\x1b\xa5\
+7H\xc6\x0c\xb5\x5c \x80\x0c4\x99\xbfS\xd1\x06\xac\
+\xdd\xd4?\x14v\x19z\xa4e\x14\x96?\xf7\x8e\xcf\x8f\
+\xe8J\xf6\xb2\xd1\x99;\xbd\x8d)H\xb7#\xbe\xae\xdb\
+;\xe5\x80:\xd2}\x06\x97%\xee\x03\xcf\xab\xce\x98\xdb\
+\xd8\x97l:\x1e\x0d\x16N\xed\xa7-\x81H\xdf\x17I\
+\xfc9\x90s\xf9\x8bq\x22g#\xec\x1e\x1f\xddXt\
+l\x7f\x9eP\x07\xe2#\xb3\x17\xab\x16\xd0\xe8\x118(\
+\xe2V\xa0\xab\xe3\xba\xa5\x05<\x15H\x03'\xb9\x14\xe2\
+\xa3ka\xe6\x94F\x9aU\x93B;+\xb7EC\x1a\
+\xb8\x0e\x07Q\xcf64\xe0\x98.\x18\xeb\xc4\x16\xa4\x9c\
+E\x14\xe4\x16\xcc\xe5r\xa0\xe6\xbd\xc0\xc8\xbe\xc1<}\
+4r~\xb3F\xe2\xab\xf21UXx\x00\x94G\x1c\
+\xc9\x02A\xf8B\xa7\xca\xd5*\x857\xf4|\xfb\xae\xbf\
+:\xfb\xb8^\x9e)\xea\xfae#\xc3z\xa82\xa7\x14\
+\xb0\xc2dXo? a\x96\xa8\x89\xd1\xcd\xaa\xc8@\
+\xce\xa8\x17\x09\xb2X\xe3\x0aH1\xf4\xbe\x1d\xc9\xcc\xb3\
+.!\xa0R\xde<\xdbl,M5\x0d\xdcA\xb2\x90\
+\x86\x0b\xe7\xdf']#\xacd@\x89\x06\xe9\xa2\xe30\
+\xef\xf2mp\xfe\x964,6\x9b0\x098}e\xc5\
+\x12\x9c\xa2\xb2\xf0)\x11\xce\xdb\x17i\xa4\x16\xa3\x0b\xed\
+=\x81(\x0aR\x12\xfc\x83\xbaiU\
+\x00\x00\x03\x0b\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x14\x00\x00\x00\x14\x08\x06\x00\x00\x00\x8d\x89\x1d\x0d\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x02\xbdIDAT8\x8d\xa5\
+\x94Oh\x5cU\x14\xc6\x7f\xdf}\x93IA\xdc\x09\xc1\
+\x96\xaa\xb5\xb6\x161MZ\x5cI\x89\xae\x5cH\xd2\x97\
+\x16[\x05\x05QD\xed\xa2\x8b\x82\x22(Xj\xc1\x8d\
+t\xa3\x82T\xeb\x1f\xd0U\x14f\xdek\xc5V\xd0B\
+\x14\xba)M&Jq\xdaX\x84\x16-n\x5c(f\
+2\xd3w?\x173\x193q$\x06\xbf\xcd\x85w\xef\
+\xf9\xdds\xbf\xf3\xce\x81\xff)\xdb\xca\xf3\xf3\xb7\xd9\x16\
+@i\xb5\x80Je\xe6\x0e\x89\xf5!\xd0\x8a\xb1t}\
+rr\xf8\xea\xf2\xfd,\x9b\xdb\x05\xa5\xe9,\x9b\x1b\x03\
+\xbe\xe9\x0b<s\xa6v\xd3\xc2B|\x19x\x14\xb4\x19\
+ F\x80\x82ju\xf6{\x9b\xa9$\xb9ql\xf7\xee\
+\xfb\xfe\x04\x86:aC}3\xacVg\xeeo4\xfc\
+1\xe8N\x89+6oJ\xd4\xda\xcf\xd36\xdb\x93\x12\
+\xaf\xc5\x98<\x99esO\xdb\xee\x89/\xf5\xc2\xe6\x86\
+!~ac\x89\x03\x17.\x8c\xbc{\xe4\x88\xe2\x0a\xcf\
+^\xca\xf3\xdas\xb6\xde\xb0\xe3W\x10\xde\x01\xff\x13\x98\
+e?\xdcl7>\x07\x82\xc4X\x9a\x8e\xce\xac\xcc\xde\
+\xb6N\x9d\x9a\xbd\xab(\xc2\xb7v\xf1x\x92\x84\xe3\x10\
+\x0f\x02H\xea-\x8a\xddx\x06\xd8\x08<\xd6\x0f\x06\x90\
+\xe7\xb5\x07m}\x1d\x82\x81\xd0\xb3'\x15[\xba@\xdb\
+\xca\xb2\xda!`\xbe\xd9\xbc\xf4Y?X[\xeb\xce\xc3\
+\xe2+v,\xff\x0d\xd2:\xd0=\xe5r\xf9C\x00\x01\
+\x9c<9\xbb\xa1(\xb8&q,MG_\xf8w\xe0\
+\xea*\x01\xc4\xc8\xd6v\xa6\x5c^+ \xcfk\x9bb\
+\x8c\x1fI\xe1\xd94\x1d\xa9w\x8c\xd0\xcf\xe0\xe9\x10\xf4\
+\xe5Z\x811\xfa!\xd0\x18x}7\xc34\x1d\xa9\x03\
+\x0f\xac\x15\x06`\xb3\xb5]\xdfX\x87\x8e\x87\xa7O_\
+\xbc\xb5\xd1h\x1d\x07_\xb4\xddX:,\x85\xa64\xf8\
+V\x9an\xfb\xbd\x1fljj*)\x97\xb7\xd4A\xe5\
+4\x1d\xb9]\x92K\x00\xcd\xe6\xe2S\xa0\x09`\xa2\xf3\
+;-\xdd\x0f4\xce\x01g\xfb\x01\x07\x07\xef\xdeg{\
+\xb3\xedC\x92\xdc}\xb2\x9d\x5c\x86nC\x5c\x8f\xd1\xcf\
+C\xf8q` .NL\xec\xe8[\xa8<\xaf\xed\x8c\
+\xd1\xef\x01W[\xad\x81\x13K\xdfC\x1b\xd8nH)\
+\xbc\x0d\xdc\x12\x82>I\x12\xef\x1a\x1f\x1f\x9d_\x09:\
+|\xd8\xa1R\xa9\x1d\x88\xd1g\x81\x18\xa3\x1e\xde\xbf\xff\
+\xde?\xba6\x01T\xab\xb5G\xc0\x9f\x82\xf6I\xfa\xd5\
+.>\xe8L\x99yP\xc5\xa6\x1e\x82m3\x0a\x8c\x03\
+\x9b$\xae\x14E|b\xef\xde\x9d\xe7\x96_\xd8\xdb?\
+@\x9an\x9f\x0e\xa1\xd8n\xf3*\xb0\x00~Q\xf2\x09\
+\x9b\xf7\x81\x83@\x01~]\xba1\xbc\x12\xb6\xccC~\
+\x93\xda+@g\xce\x1d\x05\x8eV\xab\xdfm\x94ZC\
+E\xc1\x80\xa4_\xf6\xec\xd9\xf1S?O{\xb44\xc6\
+W=\xf8\x1f\xf4\x17\xb3s>N#\xf4\x18:\x00\x00\
+\x00\x00IEND\xaeB`\x82\
+\x00\x00\x02)\
+<\
+?xml version=\x221.\
+0\x22 encoding=\x22UTF\
+-8\x22?>\x0a<svg xmlns\
+=\x22http://www.w3.\
+org/2000/svg\x22 vi\
+ewBox=\x220 0 64 64\
+\x22 width=\x2264\x22 hei\
+ght=\x2264\x22>\x0a  <rec\
+t width=\x2264\x22 hei\
+ght=\x2264\x22 rx=\x2212\x22\
+ fill=\x22#FF4444\x22/\
+>\x0a  <rect x=\x2224\x22\
+ y=\x2212\x22 width=\x221\
+6\x22 height=\x2226\x22 r\
+x=\x228\x22 fill=\x22whit\
+e\x22/>\x0a  <path d=\x22\
+M18 32 a14 14 0 \
+0 0 28 0\x22 stroke\
+=\x22white\x22 stroke-\
+width=\x223\x22 fill=\x22\
+none\x22 stroke-lin\
+ecap=\x22round\x22/>\x0a \
+ <line x1=\x2232\x22 y\
+1=\x2246\x22 x2=\x2232\x22 y\
+2=\x2254\x22 stroke=\x22w\
+hite\x22 stroke-wid\
+th=\x223\x22 stroke-li\
+necap=\x22round\x22/>\x0a\
+  <line x1=\x2224\x22 \
+y1=\x2254\x22 x2=\x2240\x22 \
+y2=\x2254\x22 stroke=\x22\
+white\x22 stroke-wi\
+dth=\x223\x22 stroke-l\
+inecap=\x22round\x22/>\
+\x0a</svg>\x0a\
+\x00\x00\x02)\
+<\
+?xml version=\x221.\
+0\x22 encoding=\x22UTF\
+-8\x22?>\x0a<svg xmlns\
+=\x22http://www.w3.\
+org/2000/svg\x22 vi\
+ewBox=\x220 0 64 64\
+\x22 width=\x2264\x22 hei\
+ght=\x2264\x22>\x0a  <rec\
+t width=\x2264\x22 hei\
+ght=\x2264\x22 rx=\x2212\x22\
+ fill=\x22#6C63FF\x22/\
+>\x0a  <rect x=\x2224\x22\
+ y=\x2212\x22 width=\x221\
+6\x22 height=\x2226\x22 r\
+x=\x228\x22 fill=\x22whit\
+e\x22/>\x0a  <path d=\x22\
+M18 32 a14 14 0 \
+0 0 28 0\x22 stroke\
+=\x22white\x22 stroke-\
+width=\x223\x22 fill=\x22\
+none\x22 stroke-lin\
+ecap=\x22round\x22/>\x0a \
+ <line x1=\x2232\x22 y\
+1=\x2246\x22 x2=\x2232\x22 y\
+2=\x2254\x22 stroke=\x22w\
+hite\x22 stroke-wid\
+th=\x223\x22 stroke-li\
+necap=\x22round\x22/>\x0a\
+  <line x1=\x2224\x22 \
+y1=\x2254\x22 x2=\x2240\x22 \
+y2=\x2254\x22 stroke=\x22\
+white\x22 stroke-wi\
+dth=\x223\x22 stroke-l\
+inecap=\x22round\x22/>\
+\x0a</svg>\x0a\
+\x00\x00\x05\x98\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00(\x00\x00\x00(\x08\x06\x00\x00\x00\x8c\xfe\xb8m\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x05JIDATX\x85\xed\
+X]lTE\x14\xfe\xce\xdc\xdd\xb5@\x04\xf1\x87R\
+EL\x8cm\xd0\x00\xbb\x0b\xe5\x01+1\xa8\x09\x0au\
+w+\xd87~\x84h\xc3\x03\x91\x18\x0co6\xfbf\
+\x02/j$\xf2P\xac\x9a\x98\xb8\xa1\xed\xbd\x1bJ \
+A@\x03\xc6\xa4K\xf7n\x0bb@M0\x06Z\x1a\
+A\x88\xa5a\x7f\xe6\xf8\xb0w\xe9\xdc\xbbw\xb7\xbb\x0b\
+\x96\x17\xbed\x93\x99s\xce\x9c\xf9\xee\x9c\x9dsf\x06\
+x\x80\xca`\x18\xc9\x16\xc3H\xb68\xe5\xe2~\x90q\
+B\xd7\xcd\x0ef:\xc5L\xa7t\xdd\xecPu\x9e\xbb\
+q\x1c\x8f'ff\xb3\xc2O\xa4\x05\x84\xe0\x06)y\
+6\x11\x11\x11\xc6\xa4\xa4+B\x88\x81\xdb\xb7\xcf\x9fk\
+oo\xcf\x95\xf7\xc4\xaf\x01\xa4\xb4\xb1\xbff\x82\xb1X\
+L\xab\xabkl\xcd\xe5h\x93\x94h\x15\x02>\x80\xc1\
+\x0c\x10\xe5'\xc9\xb7\x19\xcc9\xf8|M7u\xdd4\
+\x88\xf0\xe5\xe0\xa0\xff\x87h\x94d\xb1W\x22\xf7v\x95\
+!\xee\xeb\x1bz\xc3\xe7kJJI:\x11\xde\x02\xe0\
+\xab`\xd8l\x00\x1b\x99q<\x18L%\x0c\xc3\x5c]\
+\xcd\x9c\x15\xad`<\x9e\x98)\xa5\xe7s@n)a\
+r\x0d\xc0\x10\x80\xbf\x01d\x01<\x0e\xa0\x09\xc0\xd3\x0e\
+\xbb 3\x8e\xeb\xba\xf9\xcd\x8c\x19\xb4}\xcd\x1a\xff\xf8\
+]\x13\xec\xe9I4H\xe99\x0a`\x89Cu\x89\x99\
+\xbb\x99\xe5wmm\xcb~%\x22v\x8e\x8d\xc7\x13\x0b\
+\xa5\xf4\xac\x07\xf0\x1e\x80E\x8aj\xe3\xc4\x04/7\x8c\
+3\xe1px\xf9o\xe5\xe6\xa7r\xca\xfe\xfe\xb3\xf33\
+\x99\xec\x09\xd59\x11\xc6\x00|42\x92\xed\xea\xe8h\
+\xceL\xf1}\x00\xf2\xff[\x9f\xafi\x13\x80\x8f\x01\xcc\
+S}\x11\xf1:)i7\x80\xf5\x96\xb8'\x12\x09l\
+\x98\x92\xe0\xe1\xc3\x17\x1fJ\xa7o\x9d\x02\xb8Y\x11\x1f\
+!\xd2\xb6\x84\xc3KF+!\xe6\x84\xf5\xc11\x00\xab\
+\x14\xf18\x11\x92\xccx\xc9\x8d`\xc9M\x92N\x8f\xef\
+q\x90\xebN\xa7/\xb4\xd6J\x0e\x00\xd6\xad[<2\
+:\x9a}\x95\x99\xbeR\xc4\xb3\x98Q\x94\xa0\x0bp\xfd\
+\x0f\xf6\xf6\x0e\xae\x04\xb0\xa3\xd0g&\xc34\x97n\x8b\
+F\x03.)\xa2<\x0c#\xd9\xc2,\x1aT\x19\x11\xf5\
+K)\xe7\x10Q\xa4 *\xe8\x84c\xc9\x8a\x0823\
+\x19Fj\xaf\xe2\xeeO\xaf\x97\xdeq\xcf_\xe5\x91\xaf\
+\x10\xf8\x02\xb0\xef\x1ff\xbe\x933\x9d\x90\x92\x9fU\xfb\
+E!\xd6u\xf3e\x00/\xde\xa1GrWk\xeb\xd2\
+\xeb\xd5\x92\xb3P2t\xa5@D\x8f\xa8\xfd\x22\x82B\
+\xd0\xb6\xc9\x1e\x0f\x85B\x81\x83\xb50\xcb\xfb\xe2\xcf\x00\
+\x5c\xaebH\x0e\xe0\xa8*\xb0\xads~\xe7\x8e_\x07\
+0\x03\x00\x88hg8\xec\xff\xa4V\x82\xf7\x02\xb6\x15\
+L\xa7\xff]\x0e\x8b\x1c\x00H)\x8dig\xe4\x80\x8d\
+ 3\xadT\xba\xa3\x91H\xe0\xd24\xf3)\x82m\x17\
+\x13\xe1)\xa5\xfb\xbb[\xf9\xfa?\x10\x8b%\xe6x\xbd\
+Z\x14\x002\x99\x5cg{{\xf3\x0dW\x82\xc8\x17\xf9\
+\x02j\xdd\xb9U\xc3\xeb\xd5\xa2D\xf4\xbe\xd5\x06\x80\x9d\
+\x05\x9d#\xc4|Mi\x97-\xe2\xf7\x12D\xa2q\xb2\
+M\x8f\xaa:\xdb\x0af2\xb9N\xeb\x0b\x90\xc9\xe4:\
+\xa7\x85\x1d\x00\x80\xef\xe4>f\x8c\xa9\x1a\x1bA+\xf6\
+;1\x8d\xb0*\xd7s\x8a\xc8\x967\xef\xfb\xa5I\xd7\
+\xcdg\xa0\x1c\xc1\x98\xe5O\xaa\xfe\xbe\x13\x04\x10Q\xda\
+\x13uu\x0f\x0f\xaaJ[\x88\x0d#\xb9\x99\x99\xba\x00\
+h\x15:\xbf,\x04GB\xa1\xe0@-\xcc\xac\xf0n\
+UD\x07\xd7\xaem\xbc\xad\xda8V\x90:\xab \x07\
+\x00OJI;\xa66s\x87\xae\xa7\xde\x86r\x95\x90\
+Rv9m\x9ci\xe6\x9f\x1a\xe69]\xc3\x18\x1c:\
+44\x97\x88\xf6\xa8~\xda\xda\x82?:\xedl!\x16\
+\x82\xfe\x90\x12A\xa7\x113\xebBh\xdf2\xb3\xad\xb2\
+\x10\xc9+\xe1p\xb0j\x82\xb1XL\xcbfs\xdd\x00\
+-T\xe6\xde\xe5V\xb9l\x04\xa5\xfdH\xca\xb0N;\
+D\x14\x91\x92o\x5c\xbd\x9ay\xb7\xd2\x8bR9r>\
+_\xe3\x01\x80B\x8a\xf8\xd3P\xc8\xff\xb3\x9b}\xc9]\
+L\x84\xd3\x00\xc6'\xfb\xbc\xb9\xbe\xde\xf3}\x7f\xff\xd9\
+\xf9\xb5\x923\x8c\xe1z\x9f\xaf\xe9\x10@\x9b\x0a2f\
+\x0c\xa4\xd3\x9e\x0fK\x8d)I\x90\x19\xa3B\xf0j\xeb\
+\x9aY\xc0\xaaL&\x9b2\x0cskg'W\x9c\xa2\
+\xf6\xefOx\xfb\xfaR\xdb\x81\xdc0\x80\xd7'5t\
+^\x08\xed\xcd\xf6\xf6\xc5\xe9\xaa\x09\x02@(\x14\x1c\x10\
+\x82[\x00\xfc\xa2\x88\xe71\xa3+\x18L\x9d3\x0c\xf3\
+\x83x<\xb1\xd0m,3So\xef\x99\xe7u\xdd\x8c\
+\xd6\xd7{.\x12\xf1>f<\xa1\x98\x0c{\xbd\xda+\
+S\xdd\x12m'j]7\x0f\xc2\xe5\x02}\xf4hj\
+\xd6\xc4\x84\xdc\xa7\x86\xc6\x81\xbf\x98q\x81\x08c\xcc\xf0\
+\x0aA\x8f1\xf3R\x00s\xdd\xc9\xe3\x80\xa6ew\x84\
+B\xcd\xb7\xca\x91\x03*|\x9b\xb1\xdeP6\x1b\x86\xd9\
+-%\xf6\x12a\x99\xc3d\x01\x11\x16\x00\xf9\xb7)\xc7\
+fW\xa9\x0d\x11\x89\xdd\x91\x88\xffH%\xf3\x02U\x96\
+\xbap8p\xc24\xfd+\x98y5\xc0_\x03\xb8Y\
+\xc1\xb04\x80\x1e!8\x92L\x06\x82\xe1p\xe5\xe4\x80\
+\xa2\x15dV\x1e\x12]\x97\xc1\xba\x1f\x9f\x04p2\x9f\
+2\x16\xbd@$W0s\x03@\xf3\x88H2\xf3M\
+f\x1a\xd14$\x81\xccP%\xa1\xac\x90 \x1d\x03\xb0\
+Ai\x97\x85\xf5r:l\xfd\xa6\x07\xa5\x1e\xb3\x1f\xa0\
+\x04\xfe\x03\x80\x97%d\x8e@\x17\x93\x00\x00\x00\x00I\
+END\xaeB`\x82\
+"
+
+qt_resource_name = b"\
+\x00\x05\
+\x00o\xa6S\
+\x00i\
+\x00c\x00o\x00n\x00s\
+\x00\x09\
+\x00(\xad#\
+\x00s\
+\x00t\x00y\x00l\x00e\x00.\x00q\x00s\x00s\
+\x00\x0b\
+\x0cj,G\
+\x00r\
+\x00e\x00f\x00r\x00e\x00s\x00h\x00.\x00p\x00n\x00g\
+\x00\x12\
+\x03\xe0\xb6\x07\
+\x00t\
+\x00r\x00a\x00y\x00_\x00r\x00e\x00c\x00o\x00r\x00d\x00i\x00n\x00g\x00.\x00s\x00v\
+\x00g\
+\x00\x08\
+\x08\x8cU\xa7\
+\x00t\
+\x00r\x00a\x00y\x00.\x00s\x00v\x00g\
+\x00\x0e\
+\x04*\xda\xe7\
+\x00r\
+\x00e\x00f\x00r\x00e\x00s\x00h\x00@\x002\x00x\x00.\x00p\x00n\x00g\
+"
+
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x10\x00\x04\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\xa1A\xc3]2\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x04\x00\x00\x00\x03\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00D\x00\x00\x00\x00\x00\x01\x00\x00\x08\x0f\
+\x00\x00\x01\xa1A\xad\x12\xf8\
+\x00\x00\x00\x84\x00\x00\x00\x00\x00\x01\x00\x00\x0ci\
+\x00\x00\x01\xa1A\xb5\xf1x\
+\x00\x00\x00n\x00\x00\x00\x00\x00\x01\x00\x00\x0a<\
+\x00\x00\x01\xa1A\xad\x12\xf8\
+\x00\x00\x00(\x00\x00\x00\x00\x00\x01\x00\x00\x05\x00\
+\x00\x00\x01\xa1A\xb5\xf1x\
+"
+
+def qInitResources():
+    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
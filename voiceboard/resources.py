@@ -1,23 +1,42 @@
-"""Embedded resources (icons) for VoiceBoard.
+"""Embedded resources (icons, stylesheet) for VoiceBoard.
 
-Uses programmatically generated SVG icons so no external files are needed.
+The SVG icons in ``voiceboard/icons`` and the application stylesheet
+``voiceboard/style.qss`` are compiled into the Qt resource system, so no
+external files are needed at runtime.  After editing either, regenerate
+the resource module with::
+
+    cd voiceboard/icons && pyside6-rcc icons.qrc -o ../icons_rc.py
+
+``refresh.png`` / ``refresh@2x.png`` are 20 px and 40 px renders of
+``refresh.svg``; re-export both if the SVG changes.
 """
 
-# Tray icon SVG (microphone icon)
-TRAY_ICON_SVG = """<?xml version="1.0" encoding="UTF-8"?>
-<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 64 64" width="64" height="64">
-  <rect width="64" height="64" rx="12" fill="#6C63FF"/>
-  <rect x="24" y="12" width="16" height="26" rx="8" fill="white"/>
-  <path d="M18 32 a14 14 0 0 0 28 0" stroke="white" stroke-width="3" fill="none" stroke-linecap="round"/>
-  <line x1="32" y1="46" x2="32" y2="54" stroke="white" stroke-width="3" stroke-linecap="round"/>
-  <line x1="24" y1="54" x2="40" y2="54" stroke="white" stroke-width="3" stroke-linecap="round"/>
-</svg>"""
-
-TRAY_ICON_RECORDING_SVG = """<?xml version="1.0" encoding="UTF-8"?>
-<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 64 64" width="64" height="64">
-  <rect width="64" height="64" rx="12" fill="#FF4444"/>
-  <rect x="24" y="12" width="16" height="26" rx="8" fill="white"/>
-  <path d="M18 32 a14 14 0 0 0 28 0" stroke="white" stroke-width="3" fill="none" stroke-linecap="round"/>
-  <line x1="32" y1="46" x2="32" y2="54" stroke="white" stroke-width="3" stroke-linecap="round"/>
-  <line x1="24" y1="54" x2="40" y2="54" stroke="white" stroke-width="3" stroke-linecap="round"/>
-</svg>"""
+import functools
+
+from PySide6.QtCore import QFile
+
+from voiceboard import icons_rc  # noqa: F401  (registers the :/icons/ prefix)
+
+# Tray icon (microphone on purple)
+TRAY_ICON_PATH = ":/icons/tray.svg"
+
+# Tray icon while recording (microphone on red)
+TRAY_ICON_RECORDING_PATH = ":/icons/tray_recording.svg"
+
+# Microphone list refresh button (QIcon picks up the @2x variant on HiDPI)
+REFRESH_ICON_PATH = ":/icons/refresh.png"
+
+# Stylesheet for the entire application
+STYLESHEET_PATH = ":/style.qss"
+
+
+@functools.lru_cache(maxsize=None)
+def load_stylesheet() -> str:
+    """Return the application stylesheet (read from the resources once)."""
+    f = QFile(STYLESHEET_PATH)
+    if not f.open(QFile.ReadOnly):
+        return ""
+    try:
+        return bytes(f.readAll()).decode("utf-8")
+    finally:
+        f.close()
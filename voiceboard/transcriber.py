@@ -16,6 +16,7 @@ import datetime
 import json
 import logging
 import re
+import sys
 import threading
 from typing import Callable, Optional
 
@@ -27,6 +28,24 @@ log = logging.getLogger(__name__)
 SONIOX_WEBSOCKET_URL = "wss://stt-rt.soniox.com/transcribe-websocket"
 
 
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create an event loop, preferring uvloop / winloop when installed.
+
+    Both are drop-in replacements for the default asyncio loop with faster
+    socket I/O.  They are bundled in the packaged build (requirements.txt
+    + voiceboard.spec) and available to pip installs via the ``fast``
+    extra; fall back to asyncio if neither is installed.
+    """
+    try:
+        if sys.platform == "win32":
+            import winloop as fast_loop
+        else:
+            import uvloop as fast_loop
+    except ImportError:
+        return asyncio.new_event_loop()
+    return fast_loop.new_event_loop()
+
+
 class RealtimeTranscriber:
     """Streams audio to the Soniox STT API and emits transcription events.
 
@@ -174,7 +193,7 @@ class RealtimeTranscriber:
 
     def _run_loop(self) -> None:
         """Entry point for the background event-loop thread."""
-        self._loop = asyncio.new_event_loop()
+        self._loop = _new_event_loop()
         asyncio.set_event_loop(self._loop)
         try:
             self._loop.run_until_complete(self._session())
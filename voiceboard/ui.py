@@ -1,6 +1,6 @@
 """Modern UI for VoiceBoard using PySide6 (Qt6)."""
 
-import sys
+import functools
 from typing import Optional
 from PySide6.QtWidgets import (
     QApplication,
@@ -17,7 +17,6 @@ from PySide6.QtWidgets import (
     QFormLayout,
     QComboBox,
     QCheckBox,
-    QMessageBox,
     QSizePolicy,
     QStackedWidget,
     QTextEdit,
@@ -25,10 +24,11 @@ from PySide6.QtWidgets import (
     QFrame,
     QCompleter,
 )
-from PySide6.QtCore import Qt, QSize, Signal, QObject, QTimer
-from PySide6.QtGui import QIcon, QPixmap, QFont, QAction, QPainter, QColor, QPen, QKeySequence, QWheelEvent
+from PySide6.QtCore import Qt, QByteArray, QRect, QSignalBlocker, QSize, Signal, QTimer
+from PySide6.QtGui import QIcon, QPixmap, QFont, QAction, QPainter, QBrush, QColor, QKeySequence, QStandardItem, QTextCursor, QWheelEvent
 
-from voiceboard.resources import TRAY_ICON_SVG, TRAY_ICON_RECORDING_SVG
+from voiceboard.hotkeys import is_wayland_without_evdev, needs_evdev
+from voiceboard.resources import REFRESH_ICON_PATH, TRAY_ICON_PATH, TRAY_ICON_RECORDING_PATH
 
 
 SUPPORTED_LANGUAGE_CHOICES: list[tuple[str, str]] = [
@@ -109,58 +109,51 @@ _CHECK_ICON_SVG = """<svg xmlns="http://www.w3.org/2000/svg" width="24" height="
 </svg>"""
 
 
-def _make_icon_from_svg(svg_template: str, size: int = 24, color: str = "#b0b0d0") -> QIcon:
-    """Create a QIcon from an SVG template string with a {color} placeholder."""
-    from PySide6.QtSvg import QSvgRenderer
-    from PySide6.QtCore import QByteArray
+_QtSvg = None
 
-    svg = svg_template.replace("{color}", color)
-    pixmap = QPixmap(size, size)
-    pixmap.fill(Qt.transparent)
-    renderer = QSvgRenderer(QByteArray(svg.encode()))
-    painter = QPainter(pixmap)
-    renderer.render(painter)
-    painter.end()
-    return QIcon(pixmap)
 
+def _svg_renderer_cls():
+    """Return QSvgRenderer, importing QtSvg on first use.
 
-_REFRESH_ICON_SVG = """<svg xmlns="http://www.w3.org/2000/svg" width="24" height="24"
-  viewBox="0 0 24 24" fill="none" stroke="{color}"
-  stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
-  <path d="M21 2v6h-6"/>
-  <path d="M3 12a9 9 0 0 1 15-6.7L21 8"/>
-  <path d="M3 22v-6h6"/>
-  <path d="M21 12a9 9 0 0 1-15 6.7L3 16"/>
-</svg>"""
+    QtSvg is only needed once the first icon is rasterized, so keep its
+    import off the module-load path.
+    """
+    global _QtSvg
+    if _QtSvg is None:
+        from PySide6 import QtSvg as _QtSvg
+    return _QtSvg.QSvgRenderer
 
 
-def _make_refresh_icon(size: int = 24, color: str = "#b0b0d0") -> QIcon:
-    """Create a refresh icon from an SVG template."""
-    from PySide6.QtSvg import QSvgRenderer
-    from PySide6.QtCore import QByteArray
+@functools.lru_cache(maxsize=64)
+def _make_icon_from_svg(svg_template: str, size: int = 24, color: Optional[str] = None) -> QIcon:
+    """Render an SVG string to a *size*×*size* QIcon.
 
-    svg = _REFRESH_ICON_SVG.replace("{color}", color)
+    If *color* is given it replaces the template's {color} placeholder.
+    Results are cached per argument tuple; QIcon is implicitly shared, so
+    handing the same instance to several widgets is safe.
+    """
+    svg = svg_template if color is None else svg_template.replace("{color}", color)
     pixmap = QPixmap(size, size)
     pixmap.fill(Qt.transparent)
-    renderer = QSvgRenderer(QByteArray(svg.encode()))
+    renderer = _svg_renderer_cls()(QByteArray(svg.encode()))
     painter = QPainter(pixmap)
     renderer.render(painter)
     painter.end()
     return QIcon(pixmap)
 
 
-def svg_to_icon(svg_str: str) -> QIcon:
-    """Convert SVG string to QIcon."""
-    pixmap = QPixmap(64, 64)
-    pixmap.fill(Qt.transparent)
-    from PySide6.QtSvg import QSvgRenderer
-    from PySide6.QtCore import QByteArray
+def _bold_font(point_size: int) -> QFont:
+    """Create a bold QFont of the given point size."""
+    font = QFont()
+    font.setPointSize(point_size)
+    font.setWeight(QFont.Bold)
+    return font
 
-    renderer = QSvgRenderer(QByteArray(svg_str.encode()))
-    painter = QPainter(pixmap)
-    renderer.render(painter)
-    painter.end()
-    return QIcon(pixmap)
+
+# Header fonts are built once and shared — QFont is implicitly shared, so
+# assigning the same instance to several widgets only bumps a refcount.
+_MAIN_HEADER_FONT = _bold_font(22)
+_SETTINGS_HEADER_FONT = _bold_font(18)
 
 
 class ScrollSafeComboBox(QComboBox):
@@ -170,131 +163,18 @@ class ScrollSafeComboBox(QComboBox):
         event.ignore()
 
 
-# Stylesheet for the entire application — modern dark theme
-STYLESHEET = """
-QMainWindow, QWidget {
-    background-color: #1a1a2e;
-    color: #e0e0e0;
-    font-family: 'Helvetica Neue', sans-serif;
-    font-size: 13px;
-}
-
-QGroupBox {
-    border: 1px solid #2d2d4a;
-    border-radius: 10px;
-    margin-top: 14px;
-    padding: 18px 14px 14px 14px;
-    font-weight: bold;
-    font-size: 14px;
-    color: #b0b0d0;
-}
-
-QGroupBox::title {
-    subcontrol-origin: margin;
-    left: 16px;
-    padding: 0 6px;
-}
-
-QLabel {
-    color: #c0c0e0;
-    font-size: 13px;
-}
-
-QLineEdit {
-    background-color: #16213e;
-    border: 1px solid #2d2d4a;
-    border-radius: 6px;
-    padding: 8px 12px;
-    color: #e0e0e0;
-    font-size: 13px;
-    selection-background-color: #6C63FF;
-}
-
-QLineEdit:focus {
-    border: 1px solid #6C63FF;
-}
-
-QComboBox {
-    background-color: #16213e;
-    border: 1px solid #2d2d4a;
-    border-radius: 6px;
-    padding: 8px 12px;
-    color: #e0e0e0;
-    font-size: 13px;
-}
-
-QComboBox::drop-down {
-    border: none;
-    padding-right: 8px;
-}
-
-QComboBox QAbstractItemView {
-    background-color: #16213e;
-    border: 1px solid #2d2d4a;
-    color: #e0e0e0;
-    selection-background-color: #6C63FF;
-}
-
-QPushButton {
-    background-color: #6C63FF;
-    color: white;
-    border: none;
-    border-radius: 6px;
-    padding: 10px 20px;
-    font-size: 13px;
-    font-weight: bold;
-}
-
-QPushButton:hover {
-    background-color: #7B73FF;
-}
-
-QPushButton:pressed {
-    background-color: #5A52E0;
-}
-
-QPushButton:disabled {
-    background-color: #3a3a5a;
-    color: #666680;
-}
-
-QCheckBox {
-    color: #c0c0e0;
-    spacing: 8px;
-    font-size: 13px;
-}
-
-QCheckBox::indicator {
-    width: 18px;
-    height: 18px;
-    border-radius: 4px;
-    border: 1px solid #2d2d4a;
-    background-color: #16213e;
-}
-
-QCheckBox::indicator:checked {
-    background-color: #6C63FF;
-    border-color: #6C63FF;
-}
-
-#statusLabel {
-    font-size: 14px;
-    color: #a0a0c0;
-    padding: 4px;
-}
-
-#statusLabel[recording="true"] {
-    color: #FF6B6B;
-    font-weight: bold;
-}
-
-#levelBar {
-    background-color: #16213e;
-    border-radius: 3px;
-    min-height: 6px;
-    max-height: 6px;
-}
-"""
+class LivePreviewEdit(QTextEdit):
+    """Text area that keeps an overlay widget pinned to its top-right corner."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.corner_widget: Optional[QWidget] = None
+
+    def resizeEvent(self, event) -> None:
+        super().resizeEvent(event)
+        widget = self.corner_widget
+        if widget is not None and event.size().width() != event.oldSize().width():
+            widget.move(self.width() - widget.width() - 4, 4)
 
 
 class RecordButton(QPushButton):
@@ -303,6 +183,7 @@ class RecordButton(QPushButton):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._recording = False
+        self.setObjectName("recordBtn")
         self.setFixedSize(120, 120)
         self.setCursor(Qt.PointingHandCursor)
         self._update_style()
@@ -317,47 +198,31 @@ class RecordButton(QPushButton):
         self._update_style()
 
     def _update_style(self) -> None:
-        if self._recording:
-            self.setStyleSheet("""
-                QPushButton {
-                    background-color: #FF4444;
-                    border: 4px solid #FF6B6B;
-                    border-radius: 60px;
-                    font-size: 14px;
-                    font-weight: bold;
-                    color: white;
-                }
-                QPushButton:hover {
-                    background-color: #FF5555;
-                    border-color: #FF8888;
-                }
-            """)
-            self.setText("STOP")
-        else:
-            self.setStyleSheet("""
-                QPushButton {
-                    background-color: #6C63FF;
-                    border: 4px solid #8B83FF;
-                    border-radius: 60px;
-                    font-size: 14px;
-                    font-weight: bold;
-                    color: white;
-                }
-                QPushButton:hover {
-                    background-color: #7B73FF;
-                    border-color: #9B93FF;
-                }
-            """)
-            self.setText("START")
+        # Styled by the #recordBtn[recording="true"] rules in style.qss
+        self.setText("STOP" if self._recording else "START")
+        if self.property("recording") == self._recording:
+            return
+        self.setProperty("recording", self._recording)
+        self.style().unpolish(self)
+        self.style().polish(self)
 
 
 class AudioLevelWidget(QWidget):
     """Simple audio level meter."""
 
+    # Solid brushes built once — paintEvent allocates nothing per frame
+    _TRACK_BRUSH = QBrush(QColor(0x16, 0x21, 0x3E))
+    _LEVEL_BRUSH = QBrush(QColor(0x6C, 0x63, 0xFF))
+    _PEAK_BRUSH = QBrush(QColor(0xFF, 0x6B, 0x6B))
+    _RECORDING_BRUSH = QBrush(QColor(0xFF, 0x44, 0x44))
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedHeight(8)
         self.setMinimumWidth(200)
+        # paintEvent covers every pixel, so let Qt skip the background erase
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
         self._level = 0.0
         self._recording = False
 
@@ -371,27 +236,33 @@ class AudioLevelWidget(QWidget):
         self.update()
 
     def set_level(self, level: float) -> None:
+        old_w = int(self.width() * self._level)
+        old_peak = self._level >= 0.7
         self._level = min(1.0, max(0.0, level * 8))  # amplify for visibility
-        self.update()
+        new_w = int(self.width() * self._level)
+        if not self._recording and (self._level >= 0.7) != old_peak:
+            self.update()  # fill colour changed — repaint the whole bar
+        elif new_w != old_w:
+            # Only the strip between the old and new fill edge changed
+            self.update(QRect(min(old_w, new_w), 0, abs(new_w - old_w) + 1, self.height()))
 
     def paintEvent(self, event) -> None:
+        # Square ends are a deliberate trade-off: axis-aligned solid fills
+        # hit the raster engine's fast path and can be clipped to just the
+        # dirty strip, which antialiased rounded rects can't.
+        dirty = event.rect()
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-
-        # Background
-        painter.setPen(Qt.NoPen)
-        painter.setBrush(QColor("#16213e"))
-        painter.drawRoundedRect(self.rect(), 4, 4)
+        painter.fillRect(dirty, self._TRACK_BRUSH)
 
         # Level fill
         if self._level > 0:
-            w = int(self.width() * self._level)
-            if self._recording:
-                color = QColor("#FF4444")
-            else:
-                color = QColor("#6C63FF") if self._level < 0.7 else QColor("#FF6B6B")
-            painter.setBrush(color)
-            painter.drawRoundedRect(0, 0, w, self.height(), 4, 4)
+            fill = QRect(0, 0, int(self.width() * self._level), self.height()).intersected(dirty)
+            if not fill.isEmpty():
+                if self._recording:
+                    brush = self._RECORDING_BRUSH
+                else:
+                    brush = self._LEVEL_BRUSH if self._level < 0.7 else self._PEAK_BRUSH
+                painter.fillRect(fill, brush)
 
         painter.end()
 
@@ -424,6 +295,11 @@ class ShortcutCaptureInput(QLineEdit):
     # How long (ms) to wait for the second chord in a sequential combo.
     _SEQ_WINDOW_MS = 800
 
+    # Capture timers shared by all instances (see _init_shared_timers)
+    _release_timer: Optional[QTimer] = None
+    _seq_timer: Optional[QTimer] = None
+    _timer_owner: Optional["ShortcutCaptureInput"] = None
+
     # Qt key codes that are modifier-only
     _MODIFIER_KEYS = {
         Qt.Key_Control, Qt.Key_Shift, Qt.Key_Alt, Qt.Key_AltGr,
@@ -441,12 +317,11 @@ class ShortcutCaptureInput(QLineEdit):
         Qt.Key_Super_L: ("Super", "<super>"),
         Qt.Key_Super_R: ("Super", "<super>"),
         # Function keys
-        Qt.Key_F1: ("F1", "<f1>"), Qt.Key_F2: ("F2", "<f2>"),
-        Qt.Key_F3: ("F3", "<f3>"), Qt.Key_F4: ("F4", "<f4>"),
-        Qt.Key_F5: ("F5", "<f5>"), Qt.Key_F6: ("F6", "<f6>"),
-        Qt.Key_F7: ("F7", "<f7>"), Qt.Key_F8: ("F8", "<f8>"),
-        Qt.Key_F9: ("F9", "<f9>"), Qt.Key_F10: ("F10", "<f10>"),
-        Qt.Key_F11: ("F11", "<f11>"), Qt.Key_F12: ("F12", "<f12>"),
+        **{getattr(Qt, f"Key_F{i}"): (f"F{i}", f"<f{i}>") for i in range(1, 13)},
+        # Letters and digits — their Qt key codes equal the ASCII codes, so
+        # we never depend on event.text()
+        **{c: (chr(c), chr(c).lower()) for c in range(Qt.Key_A, Qt.Key_Z + 1)},
+        **{c: (chr(c), chr(c)) for c in range(Qt.Key_0, Qt.Key_9 + 1)},
         # Special keys
         Qt.Key_Space: ("Space", "<space>"),
         Qt.Key_Return: ("Enter", "<enter>"),
@@ -470,6 +345,14 @@ class ShortcutCaptureInput(QLineEdit):
         Qt.Key_NumLock: ("NumLock", "<num_lock>"),
     }
 
+    # Reverse map: config token → display name, derived from _KEY_NAMES so
+    # both directions share one source of truth.  "<cmd>" is the macOS
+    # spelling of "<super>" that pynput also accepts.
+    _TOKEN_DISPLAY: dict[str, str] = {
+        **{token: display for display, token in _KEY_NAMES.values()},
+        "<cmd>": "Super",
+    }
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setReadOnly(True)
@@ -477,25 +360,44 @@ class ShortcutCaptureInput(QLineEdit):
         self.setCursor(Qt.PointingHandCursor)
         self.setPlaceholderText("Click here, then press a shortcut…")
         self._shortcut_str = ""       # config-format string
+        self._display_text = ""       # display label for _shortcut_str
         self._listening = False
 
         # ── Chord capture state ──
         self._held_keys: set[int] = set()   # keys currently physically held
         self._chord_keys: list[int] = []    # all keys seen in the current chord
+        # (display, token) per key seen since capture started
+        self._key_info_cache: dict[int, tuple[str, str] | None] = {}
         self._pressing = False              # True while at least one key is held
 
-        # Short grace timer — after ALL keys are released, wait a tiny bit
-        # in case the user is still rolling off a chord.
-        self._release_timer = QTimer(self)
-        self._release_timer.setSingleShot(True)
-        self._release_timer.timeout.connect(self._on_chord_complete)
-
         # ── Sequential capture state ──
         self._first_chord: Optional[list[int]] = None  # keys from the first chord
         self._waiting_for_second = False
-        self._seq_timer = QTimer(self)
-        self._seq_timer.setSingleShot(True)
-        self._seq_timer.timeout.connect(self._on_seq_timeout)
+
+        self._init_shared_timers()
+
+    @classmethod
+    def _init_shared_timers(cls) -> None:
+        """Create the capture timers shared by all instances (once).
+
+        Only the focused field can be listening, so a single pair of timers
+        is enough; they dispatch to whichever field currently owns them.
+        """
+        if cls._release_timer is not None:
+            return
+
+        # Short grace timer — after ALL keys are released, wait a tiny bit
+        # in case the user is still rolling off a chord.
+        cls._release_timer = QTimer()
+        cls._release_timer.setSingleShot(True)
+        cls._release_timer.timeout.connect(
+            lambda: cls._timer_owner is not None and cls._timer_owner._on_chord_complete())
+
+        # Window for the second chord of a sequential combo
+        cls._seq_timer = QTimer()
+        cls._seq_timer.setSingleShot(True)
+        cls._seq_timer.timeout.connect(
+            lambda: cls._timer_owner is not None and cls._timer_owner._on_seq_timeout())
 
     def shortcut_string(self) -> str:
         """Return the stored config-format shortcut string."""
@@ -504,34 +406,35 @@ class ShortcutCaptureInput(QLineEdit):
     def set_shortcut_string(self, shortcut_str: str) -> None:
         """Set the shortcut from a config-format string and update display."""
         self._shortcut_str = shortcut_str
-        if shortcut_str:
-            self.setText(self._shortcut_to_display(shortcut_str))
-        else:
-            self.setText("")
+        self._display_text = self._shortcut_to_display(shortcut_str)
+        self.setText(self._display_text)
         self._listening = False
         self._update_style()
 
     def _update_style(self) -> None:
-        if self._listening:
-            self.setStyleSheet(
-                "QLineEdit { border: 2px solid #6C63FF; background-color: #1e1e3e; "
-                "color: #6C63FF; font-weight: bold; }"
-            )
-        else:
-            self.setStyleSheet("")
+        # Styled by the ShortcutCaptureInput[listening="true"] rule in style.qss
+        if self.property("listening") == self._listening:
+            return  # unchanged — skip the repolish
+        self.setProperty("listening", self._listening)
+        self.style().unpolish(self)
+        self.style().polish(self)
 
     def _reset_capture_state(self) -> None:
         self._held_keys.clear()
         self._chord_keys.clear()
+        self._key_info_cache.clear()
         self._pressing = False
-        self._release_timer.stop()
         self._first_chord = None
         self._waiting_for_second = False
-        self._seq_timer.stop()
+        # The timers are shared — leave them alone if another field owns them
+        if ShortcutCaptureInput._timer_owner is self:
+            self._release_timer.stop()
+            self._seq_timer.stop()
 
     def focusInEvent(self, event) -> None:
         super().focusInEvent(event)
         self._listening = True
+        ShortcutCaptureInput._timer_owner = self
         self._reset_capture_state()
         self.setText("Press a key combination…")
         self._update_style()
@@ -541,25 +444,19 @@ class ShortcutCaptureInput(QLineEdit):
         super().focusOutEvent(event)
         self._listening = False
         self._reset_capture_state()
-        if self._shortcut_str:
-            self.setText(self._shortcut_to_display(self._shortcut_str))
-        else:
-            self.setText("")
+        if ShortcutCaptureInput._timer_owner is self:
+            ShortcutCaptureInput._timer_owner = None
+        # A just-committed shortcut is already on display — skip the re-set
+        if self.text() != self._display_text:
+            self.setText(self._display_text)
         self._update_style()
         self.capture_ended.emit()
 
     def _key_info(self, qt_key: int, event=None) -> tuple[str, str] | None:
         """Return (display_name, config_token) for a Qt key code."""
-        if qt_key in self._KEY_NAMES:
-            return self._KEY_NAMES[qt_key]
-
-        # Direct mapping for A-Z and 0-9 so we never depend on event.text()
-        if Qt.Key_A <= qt_key <= Qt.Key_Z:
-            ch = chr(qt_key).lower()
-            return (ch.upper(), ch)
-        if Qt.Key_0 <= qt_key <= Qt.Key_9:
-            ch = chr(qt_key)
-            return (ch, ch)
+        info = self._KEY_NAMES.get(qt_key)
+        if info is not None:
+            return info
 
         # Try the event text for printable characters
         if event is not None:
@@ -575,6 +472,12 @@ class ShortcutCaptureInput(QLineEdit):
             return (name, f"<{name.lower()}>")
         return None
 
+    def _cached_key_info(self, qt_key: int) -> tuple[str, str] | None:
+        """Return _key_info(qt_key), computed once per key per capture."""
+        if qt_key not in self._key_info_cache:
+            self._key_info_cache[qt_key] = self._key_info(qt_key)
+        return self._key_info_cache[qt_key]
+
     def keyPressEvent(self, event) -> None:
         if not self._listening:
             return
@@ -584,6 +487,7 @@ class ShortcutCaptureInput(QLineEdit):
         # Escape → clear shortcut
         if key == Qt.Key_Escape:
             self._shortcut_str = ""
+            self._display_text = ""
             self._reset_capture_state()
             self.setText("")
             self.shortcut_changed.emit("")
@@ -627,7 +531,10 @@ class ShortcutCaptureInput(QLineEdit):
             first_parts = self._keys_display(self._first_chord)
             prefix = " + ".join(first_parts) + " , "
         if parts:
-            self.setText(prefix + " + ".join(parts) + " …")
+            text = prefix + " + ".join(parts) + " …"
+            # Re-pressing a held modifier yields the same preview — skip the repaint
+            if text != self.text():
+                self.setText(text)
 
     def _on_chord_complete(self) -> None:
         """Called after the grace period when a chord is fully released."""
@@ -672,12 +579,17 @@ class ShortcutCaptureInput(QLineEdit):
         first_tokens = "+".join(t for _, t in first_parts)
         second_tokens = "+".join(t for _, t in second_parts)
         config_text = f"{first_tokens},{second_tokens}"
+        if config_text == self._shortcut_str:
+            # Same shortcut re-entered — nothing to save or re-register
+            self.clearFocus()
+            return
 
         first_display = " + ".join(d for d, _ in first_parts)
         second_display = " + ".join(d for d, _ in second_parts)
         display_text = f"{first_display} , {second_display}"
 
         self._shortcut_str = config_text
+        self._display_text = display_text
         self.setText(display_text)
         self.shortcut_changed.emit(config_text)
         self.clearFocus()
@@ -688,10 +600,15 @@ class ShortcutCaptureInput(QLineEdit):
         if not parts:
             return
 
-        display_text = " + ".join(d for d, _ in parts)
         config_text = "+".join(t for _, t in parts)
+        if config_text == self._shortcut_str:
+            # Same shortcut re-entered — nothing to save or re-register
+            self.clearFocus()
+            return
+        display_text = " + ".join(d for d, _ in parts)
 
         self._shortcut_str = config_text
+        self._display_text = display_text
         self.setText(display_text)
         self.shortcut_changed.emit(config_text)
         self.clearFocus()
@@ -701,7 +618,7 @@ class ShortcutCaptureInput(QLineEdit):
         mods = []
         rest = []
         for k in keys:
-            info = self._key_info(k)
+            info = self._cached_key_info(k)
             if info:
                 if k in self._MODIFIER_KEYS:
                     mods.append(info)
@@ -711,12 +628,8 @@ class ShortcutCaptureInput(QLineEdit):
 
     def _keys_display(self, keys: list[int]) -> list[str]:
         """Return display names for a list of keys."""
-        result = []
-        for k in keys:
-            info = self._key_info(k)
-            if info:
-                result.append(info[0])
-        return result
+        infos = map(self._cached_key_info, keys)
+        return [info[0] for info in infos if info]
 
     @staticmethod
     def _shortcut_to_display(shortcut_str: str) -> str:
@@ -742,49 +655,20 @@ class ShortcutCaptureInput(QLineEdit):
     @staticmethod
     def _combo_to_display(combo_str: str) -> str:
         """Convert a simultaneous combo portion to display text."""
-        parts = combo_str.split("+")
-        display_parts = []
-        for part in parts:
-            display_parts.append(ShortcutCaptureInput._token_to_display(part.strip()))
-        return " + ".join(display_parts)
+        to_display = ShortcutCaptureInput._token_to_display
+        return " + ".join(to_display(part.strip()) for part in combo_str.split("+"))
 
-    @staticmethod
-    def _token_to_display(token: str) -> str:
+    @classmethod
+    def _token_to_display(cls, token: str) -> str:
         """Convert a single config token to display text."""
-        _map = {
-            "<ctrl>": "Ctrl", "<shift>": "Shift", "<alt>": "Alt",
-            "<super>": "Super", "<cmd>": "Super",
-            "<space>": "Space", "<enter>": "Enter", "<tab>": "Tab",
-            "<backspace>": "Backspace", "<delete>": "Delete",
-            "<home>": "Home", "<end>": "End",
-            "<page_up>": "PageUp", "<page_down>": "PageDown",
-            "<up>": "Up", "<down>": "Down", "<left>": "Left", "<right>": "Right",
-            "<insert>": "Insert", "<pause>": "Pause",
-            "<print_screen>": "PrintScreen", "<scroll_lock>": "ScrollLock",
-            "<caps_lock>": "CapsLock", "<num_lock>": "NumLock",
-        }
-        for i in range(1, 13):
-            _map[f"<f{i}>"] = f"F{i}"
-
         lower = token.lower()
-        if lower in _map:
-            return _map[lower]
+        if lower in cls._TOKEN_DISPLAY:
+            return cls._TOKEN_DISPLAY[lower]
         if len(token) == 1:
             return token.upper()
         return token
 
 
-class SignalBridge(QObject):
-    """Bridge for thread-safe signal communication."""
-    toggle_signal = Signal()
-    ptt_press_signal = Signal()
-    ptt_release_signal = Signal()
-    transcription_text = Signal(str, int, bool, str)  # (text, backspace_count, has_final, final_text)
-    transcription_error = Signal(str)
-    audio_level = Signal(float)
-    status_update = Signal(str)
-
-
 class SettingsPage(QWidget):
     """Settings page containing all configuration controls."""
 
@@ -792,6 +676,14 @@ class SettingsPage(QWidget):
     opened = Signal()          # emitted when the page becomes visible
     closed = Signal()          # emitted when the page is hidden
 
+    # Shown under a shortcut field when the shortcut can't work on this session
+    _WAYLAND_WARNING_HTML = (
+        "<b>⚠ This shortcut likely won't work.</b><br>"
+        "Because you're on Wayland, you can either use a modifier-based combo (e.g. <b>Ctrl+Shift+V</b>) "
+        "or grant evdev access: "
+        "<i>sudo usermod -aG input $USER</i> then re-login."
+    )
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._language_name_to_code = {name.lower(): code for name, code in SUPPORTED_LANGUAGE_CHOICES}
@@ -805,32 +697,7 @@ class SettingsPage(QWidget):
         scroll.setWidgetResizable(True)
         scroll.setFrameShape(QFrame.NoFrame)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        scroll.verticalScrollBar().setStyleSheet("""
-            QScrollBar:vertical {
-                background: transparent;
-                width: 6px;
-                margin: 4px 0;
-            }
-            QScrollBar::handle:vertical {
-                background: #3d3d5a;
-                border-radius: 3px;
-                min-height: 30px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: #6C63FF;
-            }
-            QScrollBar::handle:vertical:pressed {
-                background: #5A52E0;
-            }
-            QScrollBar::add-line:vertical,
-            QScrollBar::sub-line:vertical {
-                height: 0;
-            }
-            QScrollBar::add-page:vertical,
-            QScrollBar::sub-page:vertical {
-                background: none;
-            }
-        """)
+        scroll.verticalScrollBar().setObjectName("settingsScrollBar")
         page_layout.addWidget(scroll)
 
         content = QWidget()
@@ -844,19 +711,13 @@ class SettingsPage(QWidget):
         self.back_btn = QPushButton("← Back")
         self.back_btn.setFixedWidth(80)
         self.back_btn.setCursor(Qt.PointingHandCursor)
-        self.back_btn.setStyleSheet("""
-            QPushButton { background-color: #2d2d4a; border-radius: 6px; padding: 8px; font-size: 13px; }
-            QPushButton:hover { background-color: #3d3d5a; }
-        """)
+        self.back_btn.setObjectName("backBtn")
         self.back_btn.clicked.connect(self.back_requested.emit)
         header_row.addWidget(self.back_btn)
 
         header = QLabel("Settings")
-        hfont = QFont()
-        hfont.setPointSize(18)
-        hfont.setWeight(QFont.Bold)
-        header.setFont(hfont)
-        header.setStyleSheet("color: #6C63FF;")
+        header.setFont(_SETTINGS_HEADER_FONT)
+        header.setObjectName("settingsHeader")
         header.setAlignment(Qt.AlignCenter)
         header_row.addWidget(header, 1)
 
@@ -876,10 +737,7 @@ class SettingsPage(QWidget):
         api_layout.addWidget(self.api_key_input)
         self.show_key_btn = QPushButton("👁")
         self.show_key_btn.setFixedWidth(40)
-        self.show_key_btn.setStyleSheet("""
-            QPushButton { background-color: #2d2d4a; border-radius: 6px; padding: 8px; }
-            QPushButton:hover { background-color: #3d3d5a; }
-        """)
+        self.show_key_btn.setObjectName("showKeyBtn")
         self.show_key_btn.clicked.connect(self._toggle_key_visibility)
         api_layout.addWidget(self.show_key_btn)
         api_group.setLayout(api_layout)
@@ -894,8 +752,10 @@ class SettingsPage(QWidget):
         shortcut_layout.addRow("Toggle (start/stop):", self.toggle_input)
 
         self._toggle_warn = QLabel()
+        self._toggle_warn.setObjectName("shortcutWarning")
         self._toggle_warn.setWordWrap(True)
         self._toggle_warn.setTextFormat(Qt.RichText)
+        self._toggle_warn.setText(self._WAYLAND_WARNING_HTML)
         self._toggle_warn.hide()
         shortcut_layout.addRow("", self._toggle_warn)
 
@@ -903,20 +763,13 @@ class SettingsPage(QWidget):
         shortcut_layout.addRow("Push-to-talk (hold):", self.ptt_input)
 
         self._ptt_warn = QLabel()
+        self._ptt_warn.setObjectName("shortcutWarning")
         self._ptt_warn.setWordWrap(True)
         self._ptt_warn.setTextFormat(Qt.RichText)
+        self._ptt_warn.setText(self._WAYLAND_WARNING_HTML)
         self._ptt_warn.hide()
         shortcut_layout.addRow("", self._ptt_warn)
 
-        # Style for warning labels
-        _warn_style = (
-            "QLabel { color: #FFD580; font-size: 11px; "
-            "background-color: #2a2210; border: 1px solid #665520; "
-            "border-radius: 4px; padding: 4px 8px; }"
-        )
-        self._toggle_warn.setStyleSheet(_warn_style)
-        self._ptt_warn.setStyleSheet(_warn_style)
-
         # Update warnings when shortcuts change
         self.toggle_input.shortcut_changed.connect(
             lambda s: self._update_shortcut_warning(s, self._toggle_warn))
@@ -938,14 +791,12 @@ class SettingsPage(QWidget):
         mic_row.addWidget(self.mic_combo)
 
         self.mic_refresh_btn = QPushButton()
-        self.mic_refresh_btn.setIcon(_make_refresh_icon(24, "#b0b0d0"))
+        # Pre-rendered at the exact icon size so Qt never has to rescale it
+        self.mic_refresh_btn.setIcon(QIcon(REFRESH_ICON_PATH))
         self.mic_refresh_btn.setIconSize(QSize(20, 20))
         self.mic_refresh_btn.setFixedSize(36, 36)
         self.mic_refresh_btn.setToolTip("Refresh device list")
-        self.mic_refresh_btn.setStyleSheet("""
-            QPushButton { background-color: #2d2d4a; border-radius: 6px; padding: 4px; }
-            QPushButton:hover { background-color: #3d3d5a; }
-        """)
+        self.mic_refresh_btn.setObjectName("micRefreshBtn")
         self.mic_refresh_btn.setCursor(Qt.PointingHandCursor)
         mic_row.addWidget(self.mic_refresh_btn)
 
@@ -954,7 +805,7 @@ class SettingsPage(QWidget):
 
         # Audio level preview
         level_label = QLabel("Level preview:")
-        level_label.setStyleSheet("color: #7070a0; font-size: 12px; margin-top: 4px;")
+        level_label.setObjectName("levelLabel")
         mic_layout.addWidget(level_label)
         self.audio_level = AudioLevelWidget()
         mic_layout.addWidget(self.audio_level)
@@ -1033,20 +884,29 @@ class SettingsPage(QWidget):
 
     def populate_mic_list(self, devices: list[dict], saved_device: str = "") -> None:
         """Fill the microphone combo box with available input devices."""
-        self.mic_combo.blockSignals(True)
-        self.mic_combo.clear()
-        self.mic_combo.addItem("System Default", userData="")
+        # Build the rows (label + device index as user data) off-model,
+        # noting the saved device's row on the way, and insert them in one
+        # go so the view sees a single rowsInserted.
+        default = QStandardItem("System Default")
+        default.setData("", Qt.UserRole)
+        items = [default]
+        saved_row = 0
         for dev in devices:
-            label = f"{dev['name']}  (#{dev['index']})"
-            self.mic_combo.addItem(label, userData=str(dev["index"]))
+            value = str(dev["index"])
+            item = QStandardItem(f"{dev['name']}  (#{value})")
+            item.setData(value, Qt.UserRole)
+            if value == saved_device:
+                saved_row = len(items)
+            items.append(item)
+
+        blocker = QSignalBlocker(self.mic_combo)
+        self.mic_combo.clear()
+        self.mic_combo.model().invisibleRootItem().appendRows(items)
 
         # Restore saved selection
-        if saved_device:
-            for i in range(self.mic_combo.count()):
-                if self.mic_combo.itemData(i) == saved_device:
-                    self.mic_combo.setCurrentIndex(i)
-                    break
-        self.mic_combo.blockSignals(False)
+        if saved_row:
+            self.mic_combo.setCurrentIndex(saved_row)
+        blocker.unblock()
 
     def selected_device_index(self) -> str:
         """Return the device index string of the currently selected mic (\"\" = default)."""
@@ -1054,19 +914,13 @@ class SettingsPage(QWidget):
         return data if data else ""
 
     def _update_shortcut_warning(self, shortcut_str: str, label: QLabel) -> None:
-        """Show/hide a Wayland-specific warning for *shortcut_str*."""
-        from voiceboard.hotkeys import needs_evdev, is_wayland_without_evdev
-
-        if shortcut_str and needs_evdev(shortcut_str) and is_wayland_without_evdev():
-            label.setText(
-                "<b>⚠ This shortcut likely won't work.</b><br>"
-                "Because you're on Wayland, you can either use a modifier-based combo (e.g. <b>Ctrl+Shift+V</b>) "
-                "or grant evdev access: "
-                "<i>sudo usermod -aG input $USER</i> then re-login."
-            )
-            label.show()
-        else:
-            label.hide()
+        """Show/hide a Wayland-specific warning for *shortcut_str*.
+
+        The warning text is set once in _setup_ui; this only toggles it.
+        """
+        label.setVisible(
+            bool(shortcut_str) and needs_evdev(shortcut_str) and is_wayland_without_evdev()
+        )
 
     def _parse_language_code(self, text: str) -> str:
         """Resolve combo display text or code input to a valid language code."""
@@ -1135,6 +989,12 @@ class SettingsPage(QWidget):
         self.auto_start_cb.setChecked(config.auto_start)
         self._set_typing_mode(config.typing_mode)
 
+        # Until the device list is scanned (when the page first opens),
+        # hold just the saved choice so it is used and saved unchanged.
+        if self.mic_combo.count() == 0:
+            saved = config.input_device
+            self.populate_mic_list([{"name": "Saved microphone", "index": saved}] if saved else [], saved)
+
         # Show warnings if needed for loaded shortcuts
         self._update_shortcut_warning(config.toggle_shortcut, self._toggle_warn)
         self._update_shortcut_warning(config.ptt_shortcut, self._ptt_warn)
@@ -1164,9 +1024,23 @@ class SettingsPage(QWidget):
 class MainWindow(QMainWindow):
     """Main application window with a main page and a settings page."""
 
+    # Thread-safe signals — emitted from hotkey/audio/transcriber threads
+    # and delivered on the GUI thread via queued connections.
+    toggle_signal = Signal()
+    ptt_press_signal = Signal()
+    ptt_release_signal = Signal()
+    transcription_text = Signal(str, int, bool, str)  # (text, backspace_count, has_final, final_text)
+    transcription_error = Signal(str)
+    status_update = Signal(str)
+
+    # Meter refresh interval — roughly one display frame
+    _LEVEL_POLL_MS = 16
+
+    # Live preview updates arriving within this window are applied together
+    _LIVE_FLUSH_MS = 33
+
     def __init__(self):
         super().__init__()
-        self.signals = SignalBridge()
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -1174,7 +1048,7 @@ class MainWindow(QMainWindow):
         self.setMinimumSize(320, 450)
         self.resize(self.minimumSize())
         self.setMaximumWidth(500)
-        self.setWindowIcon(svg_to_icon(TRAY_ICON_SVG))
+        self.setWindowIcon(_tray_icon(False))
 
         central = QWidget()
         self.setCentralWidget(central)
@@ -1194,16 +1068,13 @@ class MainWindow(QMainWindow):
         # ── Header ──
         header = QLabel("VoiceBoard")
         header.setAlignment(Qt.AlignCenter)
-        hfont = QFont()
-        hfont.setPointSize(22)
-        hfont.setWeight(QFont.Bold)
-        header.setFont(hfont)
-        header.setStyleSheet("color: #6C63FF; margin-bottom: 4px;")
+        header.setFont(_MAIN_HEADER_FONT)
+        header.setObjectName("header")
         layout.addWidget(header)
 
         subtitle = QLabel("Voice-to-text keyboard powered by Soniox")
         subtitle.setAlignment(Qt.AlignCenter)
-        subtitle.setStyleSheet("color: #7070a0; font-size: 12px; margin-bottom: 8px;")
+        subtitle.setObjectName("subtitle")
         layout.addWidget(subtitle)
 
         # ── Warning banner (hidden by default) ──
@@ -1212,17 +1083,7 @@ class MainWindow(QMainWindow):
         self.warning_banner.setOpenExternalLinks(False)
         self.warning_banner.setTextFormat(Qt.RichText)
         self.warning_banner.setAlignment(Qt.AlignCenter)
-        self.warning_banner.setStyleSheet(
-            "QLabel {"
-            "  background-color: #3a2a10;"
-            "  color: #FFD580;"
-            "  border: 1px solid #665520;"
-            "  border-radius: 8px;"
-            "  padding: 10px 14px;"
-            "  font-size: 12px;"
-            "}"
-            "QLabel a { color: #FFB347; text-decoration: underline; }"
-        )
+        self.warning_banner.setObjectName("warningBanner")
         self.warning_banner.hide()
         layout.addWidget(self.warning_banner)
 
@@ -1234,11 +1095,24 @@ class MainWindow(QMainWindow):
         layout.addLayout(btn_container)
 
         # ── Status ──
-        self.status_label = QLabel("Ready — press Start or use a shortcut")
-        self.status_label.setObjectName("statusLabel")
-        self.status_label.setAlignment(Qt.AlignCenter)
-        self.status_label.setWordWrap(True)
-        layout.addWidget(self.status_label)
+        # Two pre-styled labels — switching the stack page on record/stop
+        # avoids re-resolving the stylesheet for a property change.
+        self._status_idle = QLabel("Ready — press Start or use a shortcut")
+        self._status_idle.setObjectName("statusLabel")
+        self._status_recording = QLabel("🔴 Recording... speak now")
+        self._status_recording.setObjectName("statusLabelRecording")
+        self._status_stack = QStackedWidget()
+        # QStackedLayout reports itself as expanding; don't let the stack
+        # soak up spare height the way the single label never did.
+        self._status_stack.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Maximum)
+        for label in (self._status_idle, self._status_recording):
+            label.setAlignment(Qt.AlignCenter)
+            # Status strings are never rich text — skip per-setText detection.
+            label.setTextFormat(Qt.PlainText)
+            label.setWordWrap(True)
+            self._status_stack.addWidget(label)
+        self._fit_status_stack()
+        layout.addWidget(self._status_stack)
 
         # ── Live Transcription Preview ──
         self._preview_container = QWidget()
@@ -1247,18 +1121,11 @@ class MainWindow(QMainWindow):
         preview_layout.setContentsMargins(0, 0, 0, 0)
         preview_layout.setSpacing(0)
 
-        self.live_preview = QTextEdit()
+        self.live_preview = LivePreviewEdit()
         self.live_preview.setObjectName("livePreview")
         self.live_preview.setReadOnly(True)
         self.live_preview.setMinimumHeight(60)
         self.live_preview.setMaximumHeight(120)
-        self.live_preview.setStyleSheet(
-            "QTextEdit { color: #b0b0d0; font-size: 15px; font-style: italic; "
-            "padding: 8px 28px 8px 8px; background-color: #16213e; border-radius: 8px; border: none; }"
-            "QScrollBar:vertical { width: 6px; background: transparent; }"
-            "QScrollBar::handle:vertical { background: #2d2d4a; border-radius: 3px; min-height: 20px; }"
-            "QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical { height: 0; }"
-        )
         preview_layout.addWidget(self.live_preview)
 
         # Small copy icon button overlaid inside the text area (top-right)
@@ -1268,25 +1135,14 @@ class MainWindow(QMainWindow):
         self.copy_btn.setIcon(_make_icon_from_svg(_COPY_ICON_SVG, 16, "#b0b0d0"))
         self.copy_btn.setCursor(Qt.PointingHandCursor)
         self.copy_btn.setToolTip("Copy all session text")
-        self.copy_btn.setStyleSheet("""
-            QPushButton {
-                background-color: rgba(45, 45, 74, 0.85);
-                border-radius: 5px;
-                border: none;
-                padding: 0px;
-            }
-            QPushButton:hover { background-color: rgba(61, 61, 90, 0.95); }
-        """)
+        self.copy_btn.setObjectName("copyBtn")
         self.copy_btn.clicked.connect(self._copy_session_text)
-        # Reposition the button whenever the text area resizes
-        self.live_preview.installEventFilter(self)
+        # The text area repositions the button whenever it is resized
+        self.live_preview.corner_widget = self.copy_btn
 
         self._preview_container.hide()
         layout.addWidget(self._preview_container)
 
-        # Session text accumulator — stores ALL text from the session
-        self._session_text = ""
-
         layout.addStretch()
 
         # ── Bottom buttons row ──
@@ -1295,33 +1151,13 @@ class MainWindow(QMainWindow):
 
         self.settings_btn = QPushButton("Settings")
         self.settings_btn.setCursor(Qt.PointingHandCursor)
-        self.settings_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2d2d4a;
-                border-radius: 8px;
-                padding: 12px 20px;
-                font-size: 14px;
-                font-weight: bold;
-                color: #b0b0d0;
-            }
-            QPushButton:hover { background-color: #3d3d5a; color: #e0e0e0; }
-        """)
+        self.settings_btn.setObjectName("settingsBtn")
         self.settings_btn.clicked.connect(self._show_settings)
         bottom_row.addWidget(self.settings_btn)
 
         self.quit_btn = QPushButton("Quit")
         self.quit_btn.setCursor(Qt.PointingHandCursor)
-        self.quit_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2d2d4a;
-                border-radius: 8px;
-                padding: 12px 20px;
-                font-size: 14px;
-                font-weight: bold;
-                color: #b0b0d0;
-            }
-            QPushButton:hover { background-color: #4a2030; color: #FF6B6B; }
-        """)
+        self.quit_btn.setObjectName("quitBtn")
         self.quit_btn.clicked.connect(QApplication.instance().quit)
         bottom_row.addWidget(self.quit_btn)
 
@@ -1347,24 +1183,72 @@ class MainWindow(QMainWindow):
         self.audio_level = self.settings_page.audio_level
 
         # ── Connect signals ──
-        self.signals.audio_level.connect(self.audio_level.set_level)
-        self.signals.status_update.connect(self._set_status)
+        self.status_update.connect(self._set_status)
+
+        # ── Audio level polling ──
+        # The audio thread only stores the latest level; this timer hands it
+        # to the meter at most once per frame while the settings page (where
+        # the meter lives) is shown, instead of queuing a signal per block.
+        self._latest_level = 0.0
+        self._shown_level = 0.0
+        self._level_timer = QTimer(self)
+        self._level_timer.setInterval(self._LEVEL_POLL_MS)
+        self._level_timer.timeout.connect(self._poll_audio_level)
+
+        # ── Live preview coalescing ──
+        # Transcription updates are merged into one pending edit (backspaces
+        # still owed to the document + text to append) and applied once per
+        # _LIVE_FLUSH_MS, so a burst of tokens costs a single relayout.
+        self._pending_chunks: list[str] = []
+        self._pending_bs = 0
+        self._live_flush_timer = QTimer(self)
+        self._live_flush_timer.setSingleShot(True)
+        self._live_flush_timer.setInterval(self._LIVE_FLUSH_MS)
+        self._live_flush_timer.timeout.connect(self._flush_live_text)
 
     def _show_settings(self) -> None:
         """Switch to the settings page."""
         self.setMinimumSize(500, 700)
         self._stack.setCurrentIndex(1)
+        self._level_timer.start()
         self.settings_page.opened.emit()
 
     def _show_main(self) -> None:
         """Switch back to the main page."""
+        self._level_timer.stop()
         self._stack.setCurrentIndex(0)
+        self._flush_live_text()
         self.setMinimumSize(320, 450)
         self.resize(self.minimumSize())
         self.settings_page.closed.emit()
 
+    def post_audio_level(self, level: float) -> None:
+        """Record the latest audio level (safe to call from any thread)."""
+        self._latest_level = level
+
+    def _poll_audio_level(self) -> None:
+        """Push the latest audio level to the meter if it changed."""
+        level = self._latest_level
+        if level != self._shown_level:
+            self._shown_level = level
+            self.audio_level.set_level(level)
+
+    def _fit_status_stack(self) -> None:
+        """Size the status stack to the current label only.
+
+        QStackedWidget sizes to its tallest page; ignoring the hidden
+        label's height keeps the layout as it was with a single label.
+        """
+        current = self._status_stack.currentWidget()
+        for label in (self._status_idle, self._status_recording):
+            vertical = QSizePolicy.Preferred if label is current else QSizePolicy.Ignored
+            label.setSizePolicy(QSizePolicy.Preferred, vertical)
+        self._status_stack.updateGeometry()
+
     def _set_status(self, text: str) -> None:
-        self.status_label.setText(text)
+        label = self._status_stack.currentWidget()
+        if label.text() != text:
+            label.setText(text)
 
     def show_warning(self, html: str) -> None:
         """Show a warning banner on the main page with the given rich-text."""
@@ -1377,59 +1261,95 @@ class MainWindow(QMainWindow):
 
     def set_recording_state(self, recording: bool) -> None:
         """Update UI to reflect recording state."""
+        if self.record_btn.recording == recording:
+            return
         self.record_btn.recording = recording
-        if recording:
-            self.status_label.setProperty("recording", "true")
-            self.status_label.setText("🔴 Recording... speak now")
-            # Reset session text and preview when starting a new session
-            self._session_text = ""
-            self.live_preview.clear()
-            self._preview_container.show()
-            # Switch to main page so the user sees the recording state
-            self._show_main()
-        else:
-            self.status_label.setProperty("recording", "false")
+        self._status_stack.setCurrentIndex(1 if recording else 0)
+        self._fit_status_stack()
+        if not recording:
             # Keep the preview container visible so the user can still
             # see and copy the text from the session that just ended.
-        self.status_label.style().unpolish(self.status_label)
-        self.status_label.style().polish(self.status_label)
+            return
+        self._status_recording.setText("🔴 Recording... speak now")
+        # Reset the session text (held by the preview) for a new session
+        self._live_flush_timer.stop()
+        self._pending_chunks.clear()
+        self._pending_bs = 0
+        self.live_preview.clear()
+        self._preview_container.show()
+        # Switch to main page so the user sees the recording state
+        self._show_main()
 
     def update_live_text(self, text: str, backspace_count: int) -> None:
         """Update the live preview — erase *backspace_count* chars then append *text*.
 
-        Also maintains ``_session_text`` which accumulates all text from
-        the current session for the copy button.
+        The edit is buffered and applied by _flush_live_text shortly after,
+        together with any other updates that arrive in the meantime.
+        """
+        if not text and backspace_count <= 0:
+            return
+        # Pending text is kept as the list of received pieces, so a long
+        # buffer (e.g. while hidden) is never re-copied per update.
+        chunks = self._pending_chunks
+        # Backspaces eat not-yet-applied text first; the rest is owed to
+        # the document.
+        while backspace_count > 0 and chunks:
+            tail = chunks[-1]
+            if len(tail) <= backspace_count:
+                backspace_count -= len(tail)
+                chunks.pop()
+            else:
+                chunks[-1] = tail[:-backspace_count]
+                backspace_count = 0
+        self._pending_bs += max(backspace_count, 0)
+        if text:
+            chunks.append(text)
+        # While the preview is out of sight (window hidden to the tray or the
+        # settings page open) keep buffering; showEvent / _show_main apply
+        # everything in one go.
+        if self._stack.currentIndex() != 0 or not self.isVisible():
+            return
+        if not self._live_flush_timer.isActive():
+            self._live_flush_timer.start()
+
+    def _flush_live_text(self) -> None:
+        """Apply the pending live preview edit.
+
+        The preview document holds all text from the current session (used
+        by the copy button) and is edited in place at its end, so earlier
+        text is never re-laid out.
         """
-        current = self.live_preview.toPlainText()
-        if backspace_count > 0:
-            current = current[:-backspace_count] if backspace_count < len(current) else ""
-        new_content = current + text
-        self.live_preview.setPlainText(new_content)
+        self._live_flush_timer.stop()
+        text, backspace_count = "".join(self._pending_chunks), self._pending_bs
+        self._pending_chunks.clear()
+        self._pending_bs = 0
+        if not text and backspace_count <= 0:
+            return
+        doc = self.live_preview.document()
+        cursor = QTextCursor(doc)
+        # Walk back by code points rather than QTextCursor.Left, which
+        # moves by grapheme cluster and would over-delete combining marks.
+        pos = doc.characterCount() - 1
+        end = pos
+        remaining = backspace_count
+        while remaining > 0 and pos > 0:
+            pos -= 1
+            if pos > 0 and 0xDC00 <= ord(doc.characterAt(pos)) <= 0xDFFF:
+                pos -= 1  # low surrogate — step over the whole pair
+            remaining -= 1
+        cursor.setPosition(pos)
+        cursor.setPosition(end, QTextCursor.KeepAnchor)
+        cursor.insertText(text)
 
         # Auto-scroll to the bottom so the latest words are always visible
         scrollbar = self.live_preview.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
 
-        # Update the session accumulator: apply the same backspace logic
-        if backspace_count > 0:
-            self._session_text = (
-                self._session_text[:-backspace_count]
-                if backspace_count < len(self._session_text)
-                else ""
-            )
-        self._session_text += text
-
-    def eventFilter(self, obj, event) -> bool:
-        """Reposition the copy button when the preview text area is resized."""
-        from PySide6.QtCore import QEvent
-        if obj is self.live_preview and event.type() == QEvent.Resize:
-            self.copy_btn.move(self.live_preview.width() - 30, 4)
-        return super().eventFilter(obj, event)
-
     def _copy_session_text(self) -> None:
         """Copy all accumulated session text to the clipboard."""
+        self._flush_live_text()
         clipboard = QApplication.clipboard()
-        clipboard.setText(self._session_text)
+        clipboard.setText(self.live_preview.toPlainText())
         # Brief visual feedback — swap to a checkmark icon
         self.copy_btn.setIcon(_make_icon_from_svg(_CHECK_ICON_SVG, 16, "#6C63FF"))
         QTimer.singleShot(1500, lambda: self.copy_btn.setIcon(
@@ -1452,20 +1372,58 @@ class MainWindow(QMainWindow):
         """Write UI field values back to config object."""
         self.settings_page.save_to_config(config)
 
+    def showEvent(self, event) -> None:
+        """Resume meter polling or catch up the live preview, by page."""
+        super().showEvent(event)
+        if self._stack.currentIndex() == 1:
+            self._level_timer.start()
+        else:
+            self._flush_live_text()
+
+    def hideEvent(self, event) -> None:
+        """Stop meter polling while the window is hidden to the tray."""
+        super().hideEvent(event)
+        self._level_timer.stop()
+
     def closeEvent(self, event) -> None:
         """Minimize to tray instead of quitting."""
         event.ignore()
         self.hide()
 
 
+# Tray icons keyed by recording state — created once on first use (icons
+# need a QGuiApplication, so this can't happen at import time).  QIcon
+# loads the SVG from the Qt resource system and caches its rasterized
+# pixmaps per requested size.
+_TRAY_ICONS: dict[bool, QIcon] = {}
+
+
+def _tray_icon(recording: bool) -> QIcon:
+    """Return the cached tray icon for the idle or recording state."""
+    icon = _TRAY_ICONS.get(recording)
+    if icon is None:
+        icon = QIcon(TRAY_ICON_RECORDING_PATH if recording else TRAY_ICON_PATH)
+        _TRAY_ICONS[recording] = icon
+    return icon
+
+
+def set_tray_recording(tray: QSystemTrayIcon, recording: bool) -> None:
+    """Swap the tray icon to reflect the recording state."""
+    tray.setIcon(_tray_icon(recording))
+
+
 def create_tray_icon(app: QApplication, window: MainWindow) -> QSystemTrayIcon:
     """Create and configure the system tray icon."""
-    tray = QSystemTrayIcon(svg_to_icon(TRAY_ICON_SVG), app)
+    tray = QSystemTrayIcon(_tray_icon(False), app)
+
+    def _show_window():
+        window.showNormal()
+        window.raise_()
+        window.activateWindow()
 
     menu = QMenu()
     show_action = QAction("Show VoiceBoard", menu)
-    show_action.triggered.connect(window.show)
-    show_action.triggered.connect(window.raise_)
+    show_action.triggered.connect(_show_window)
     menu.addAction(show_action)
 
     menu.addSeparator()
@@ -1478,12 +1436,11 @@ def create_tray_icon(app: QApplication, window: MainWindow) -> QSystemTrayIcon:
 
     def _on_tray_activated(reason):
         if reason in (QSystemTrayIcon.Trigger, QSystemTrayIcon.DoubleClick):
+            # Only a hidden or minimized window is (re)activated
             if window.isVisible() and not window.isMinimized():
                 window.hide()
             else:
-                window.showNormal()
-                window.raise_()
-                window.activateWindow()
+                _show_window()
 
     tray.activated.connect(_on_tray_activated)
     tray.setToolTip("VoiceBoard — Voice Keyboard")